@@ -16,10 +16,46 @@ Design constraints:
 """
 
 import json
+import mmap
 import os
 import re
 from typing import Any, Dict, List, Tuple, Optional
 
+try:
+    import orjson  # Optional: faster parsing of larger database files.
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# Below this size the stdlib parser is as fast as orjson once call overhead
+# is accounted for.
+_ORJSON_MIN_BYTES = 16 * 1024
+
+
+# Pre-compiled patterns used by the normalization helpers. These run once per
+# DIMM (and again on re-resolution), so compile them once at import time.
+_RE_XMP_FULL = re.compile(r"(\d{4})-(\d{2})-(\d{2})-(\d{2})")
+_RE_XMP_SIMPLE = re.compile(r"(\d{4})C(\d{2})")
+_RE_FOUR_DIGITS = re.compile(r"\d{4}")
+_RE_RANK = re.compile(r"\dR")
+_RE_LEADING_NUM = re.compile(r"^(\d+(?:\.\d+)?)")
+
+
+# Constraints compared against DIMM strings; load_database rejects entries
+# where these are not JSON strings so matching never has to coerce them.
+_STRING_CONSTRAINT_KEYS: Tuple[str, ...] = (
+    "manufacturer",
+    "dram_mfg",
+    "part_number_contains",
+    "part_number_exact",
+    "gskill_sticker_code",
+    "crucial_sticker_suffix",
+    "corsair_version",
+    "timings_xmp",
+    "timings_jdec",
+    "voltage_xmp",
+    "hynix_ic_parse_8th",
+)
+
 
 def load_database(filepath: str = "die_database.json") -> List[Dict[str, Any]]:
     """
@@ -27,12 +63,14 @@ def load_database(filepath: str = "die_database.json") -> List[Dict[str, Any]]:
 
     Behavior:
     - Resolve the JSON path relative to this file.
-    - Load JSON content.
+    - Load JSON content (via orjson over a read-only mmap when installed and
+      the file is large enough to benefit; otherwise the stdlib json module).
     - Validate structure:
       * Top-level must be a list.
       * Each item must be a dict containing:
         - "priority": int
         - "die_type": non-empty str
+        - string-valued constraints (see _STRING_CONSTRAINT_KEYS) must be str
       * Other keys are accepted as-is.
     - Sort entries by:
       * Descending "priority"
@@ -50,8 +88,18 @@ def load_database(filepath: str = "die_database.json") -> List[Dict[str, Any]]:
     base_dir = os.path.dirname(os.path.abspath(__file__))
     db_path = os.path.join(base_dir, filepath)
 
-    with open(db_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None and os.path.getsize(db_path) > _ORJSON_MIN_BYTES:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+        # see the same exception type either way.
+        # Parse straight out of the page cache instead of copying the file
+        # into a bytes object first.
+        with open(db_path, "rb") as fb:
+            with mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+    else:
+        with open(db_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if not isinstance(data, list):
         raise ValueError("die_database.json must contain a top-level JSON array")
@@ -71,6 +119,10 @@ def load_database(filepath: str = "die_database.json") -> List[Dict[str, Any]]:
         if not isinstance(raw["die_type"], str) or not raw["die_type"].strip():
             raise ValueError(f"Entry {idx} 'die_type' must be a non-empty string")
 
+        for key in _STRING_CONSTRAINT_KEYS:
+            if key in raw and not isinstance(raw[key], str):
+                raise ValueError(f"Entry {idx} '{key}' must be a string")
+
         validated.append(raw)
 
     # Sort by descending priority, stable within equal priorities
@@ -98,14 +150,19 @@ def parse_xmp_from_part_number(part_number: Optional[str]) -> Optional[str]:
 
     text = str(part_number)
 
+    # Both patterns start with a 4-digit frequency; one quick scan rules out
+    # part numbers without one before trying either.
+    if not _RE_FOUR_DIGITS.search(text):
+        return None
+
     # More specific: full timing pattern
-    full_pattern = re.search(r"(\d{4})-(\d{2})-(\d{2})-(\d{2})", text)
+    full_pattern = _RE_XMP_FULL.search(text)
     if full_pattern:
         freq, t1, t2, t3 = full_pattern.groups()
         return f"{freq}-{t1}-{t2}-{t3}"
 
     # Less specific: frequency + CL pattern
-    simple = re.search(r"(\d{4})C(\d{2})", text)
+    simple = _RE_XMP_SIMPLE.search(text)
     if simple:
         freq, cl = simple.groups()
         return f"{freq}-{cl}"
@@ -113,28 +170,27 @@ def parse_xmp_from_part_number(part_number: Optional[str]) -> Optional[str]:
     return None
 
 
+# Canonical DDR generation for each accepted "DDRx" core token.
+_GENERATIONS: Dict[str, str] = {
+    "DDR": "DDR1",
+    "DDR1": "DDR1",
+    "DDR2": "DDR2",
+    "DDR3": "DDR3",
+    "DDR4": "DDR4",
+    "DDR5": "DDR5",
+}
+
+
 def _normalize_generation(value: Any) -> Optional[str]:
     if not value:
         return None
     s = str(value).strip().upper()
-    # Keep only DDRx prefix
-    if s.startswith("DDR"):
-        # e.g. "DDR4 SDRAM" -> "DDR4"
-        parts = s.split()
-        core = parts[0]
-        # Normalize variants like DDR-4
-        core = core.replace("-", "")
-        if core in {"DDR", "DDR1"}:
-            return "DDR1"
-        if core == "DDR2":
-            return "DDR2"
-        if core == "DDR3":
-            return "DDR3"
-        if core == "DDR4":
-            return "DDR4"
-        if core == "DDR5":
-            return "DDR5"
-    return None
+    # Already canonical (the common case): no splitting needed.
+    generation = _GENERATIONS.get(s)
+    if generation is not None or not s.startswith("DDR"):
+        return generation
+    # Keep only DDRx prefix, e.g. "DDR4 SDRAM" -> "DDR4"; normalize "DDR-4"
+    return _GENERATIONS.get(s.split(None, 1)[0].replace("-", ""))
 
 
 def _normalize_manufacturer(value: Any) -> Optional[str]:
@@ -169,6 +225,15 @@ def _normalize_dram_mfg(value: Any) -> Optional[str]:
     return s
 
 
+def _is_plain_number(s: str) -> bool:
+    """
+    True for unsigned decimals like "16" or "16.5" (no sign, exponent or
+    bare "." forms), which is all float() should be trusted with here.
+    """
+    whole, dot, frac = s.partition(".")
+    return whole.isdecimal() and (not dot or frac.isdecimal())
+
+
 def _parse_module_gb(value: Any) -> Optional[float]:
     if value is None:
         return None
@@ -184,20 +249,17 @@ def _parse_module_gb(value: Any) -> Optional[float]:
     # Patterns:
     # - "16384 MB", "32768MB"
     # - "16 GB", "16GB"
-    mb_match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*MB\s*$", s)
-    gb_match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*GB\s*$", s)
-
-    if mb_match:
-        mb = float(mb_match.group(1))
+    if s.endswith("MB"):
+        mb = s[:-2].rstrip()
         # convert MB to GB
-        return mb / 1024.0
+        return float(mb) / 1024.0 if _is_plain_number(mb) else None
 
-    if gb_match:
-        gb = float(gb_match.group(1))
-        return gb
+    if s.endswith("GB"):
+        gb = s[:-2].rstrip()
+        return float(gb) if _is_plain_number(gb) else None
 
     # If plain number, assume GB
-    if re.fullmatch(r"\d+(?:\.\d+)?", s):
+    if _is_plain_number(s):
         return float(s)
 
     return None
@@ -211,7 +273,7 @@ def _normalize_module_ranks(value: Any) -> Optional[str]:
         return None
 
     # Accept already normalized forms like "1R", "2R"
-    if re.fullmatch(r"\dR", s):
+    if _RE_RANK.fullmatch(s):
         return s
 
     # Handle words
@@ -229,6 +291,25 @@ def _normalize_module_ranks(value: Any) -> Optional[str]:
     return None
 
 
+def _bit_width_digits(s: str) -> str:
+    """
+    Return the first digit run followed by optional whitespace and "bit"
+    ("8 bits" -> "8", "2 x 16bit" -> "16"), or "" if there is none.
+    """
+    idx = s.find("bit")
+    while idx != -1:
+        end = idx
+        while end > 0 and s[end - 1].isspace():
+            end -= 1
+        start = end
+        while start > 0 and s[start - 1].isdecimal():
+            start -= 1
+        if start < end:
+            return s[start:end]
+        idx = s.find("bit", idx + 1)
+    return ""
+
+
 def _normalize_chip_org(value: Any) -> Optional[str]:
     if not value:
         return None
@@ -239,19 +320,60 @@ def _normalize_chip_org(value: Any) -> Optional[str]:
     # Examples:
     # - "8 bits"  -> "x8"
     # - "16 bits" -> "x16"
-    bits_match = re.search(r"(\d+)\s*bits?", s)
-    if bits_match:
-        return f"x{bits_match.group(1)}"
+    bits = _bit_width_digits(s)
+    if bits:
+        return f"x{bits}"
 
     # If already like x8/x16 (case-insensitive)
-    x_match = re.fullmatch(r"x\d+", s)
-    if x_match:
-        return s.lower()
+    if s.startswith("x") and s[1:].isdecimal():
+        return s
 
     return None
 
 
-def _extract_first_str(d: Dict[str, Any], keys: List[str]) -> Optional[str]:
+# SPD/parser key aliases for each normalized field, in priority order.
+_FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "generation": ("generation", "Memory Type", "DRAM Generation"),
+    "manufacturer": (
+        "Module Manufacturer",
+        "Manufacturer",
+        "manufacturer",
+        "Brand",
+        "Module Vendor",
+    ),
+    "dram_mfg": ("DRAM Manufacturer", "DRAM MFG", "IC Manufacturer", "dram_mfg"),
+    "module_gb": (
+        "module_gb",
+        "Module Capacity",
+        "Module Capacity (MB)",
+        "Size",
+        "Module Size",
+    ),
+    "module_ranks": ("module_ranks", "Ranks", "Rank", "rank", "Module Ranks"),
+    "chip_org": ("chip_org", "SDRAM Device Width", "Chip Organization", "Organization"),
+    "module_part_number": (
+        "Part Number",
+        "Module Part Number",
+        "module_part_number",
+        "PartNumber",
+        "P/N",
+    ),
+    "timings_jdec": ("timings_jdec", "timings_jedec", "JEDEC Timings"),
+    "voltage_xmp": ("voltage_xmp", "XMP Voltage", "Voltage XMP"),
+    "voltage_jdec": ("JEDEC_voltage", "Module Nominal Voltage", "Nominal Voltage"),
+}
+
+
+# User-supplied sticker / IC fields copied through as stripped strings.
+_PASSTHROUGH_FIELDS: Tuple[str, ...] = (
+    "gskill_sticker_code",
+    "corsair_version",
+    "crucial_sticker_suffix",
+    "hynix_ic_part_number",
+)
+
+
+def _extract_first_str(d: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
     for key in keys:
         if key in d and d[key]:
             val = str(d[key]).strip()
@@ -260,6 +382,18 @@ def _extract_first_str(d: Dict[str, Any], keys: List[str]) -> Optional[str]:
     return None
 
 
+def _first_truthy(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """
+    Equivalent of `d.get(k1) or d.get(k2) or ...`: the first truthy value, or
+    the last key's value when none are truthy.
+    """
+    for key in keys:
+        val = d.get(key)
+        if val:
+            return val
+    return val
+
+
 def normalize_dimm_data(dimm: Dict[str, Any]) -> Dict[str, Any]:
     """
     Produce a normalized view of DIMM/module metadata for heuristic matching.
@@ -268,104 +402,54 @@ def normalize_dimm_data(dimm: Dict[str, Any]) -> Dict[str, Any]:
     - Does NOT mutate the input dict.
     - Intended to be merged back by caller via: dimm.update(normalize_dimm_data(dimm)).
     - Uses conservative parsing: only emits keys where a safe interpretation exists.
+    - Source keys for each field are taken from _FIELD_ALIASES, first match wins.
     """
     norm: Dict[str, Any] = {}
 
-    # generation
-    gen = (
-        _normalize_generation(dimm.get("generation"))
-        or _normalize_generation(dimm.get("Memory Type"))
-        or _normalize_generation(dimm.get("DRAM Generation"))
-    )
+    # generation: first alias that normalizes cleanly
+    gen = None
+    for key in _FIELD_ALIASES["generation"]:
+        gen = _normalize_generation(dimm.get(key))
+        if gen:
+            break
     if gen:
         norm["generation"] = gen
 
     # manufacturer (module/brand)
-    manufacturer = _extract_first_str(
-        dimm,
-        [
-            "Module Manufacturer",
-            "Manufacturer",
-            "manufacturer",
-            "Brand",
-            "Module Vendor",
-        ],
-    )
+    manufacturer = _extract_first_str(dimm, _FIELD_ALIASES["manufacturer"])
     manufacturer = _normalize_manufacturer(manufacturer)
     if manufacturer:
         norm["manufacturer"] = manufacturer
 
     # dram manufacturer (IC vendor)
-    dram_mfg = _extract_first_str(
-        dimm,
-        [
-            "DRAM Manufacturer",
-            "DRAM MFG",
-            "IC Manufacturer",
-            "dram_mfg",
-        ],
-    )
+    dram_mfg = _extract_first_str(dimm, _FIELD_ALIASES["dram_mfg"])
     dram_mfg = _normalize_dram_mfg(dram_mfg)
     if dram_mfg:
         norm["dram_mfg"] = dram_mfg
 
     # module_gb
-    module_gb_source = (
-        dimm.get("module_gb")
-        or dimm.get("Module Capacity")
-        or dimm.get("Module Capacity (MB)")
-        or dimm.get("Size")
-        or dimm.get("Module Size")
-    )
-    module_gb = _parse_module_gb(module_gb_source)
+    module_gb = _parse_module_gb(_first_truthy(dimm, _FIELD_ALIASES["module_gb"]))
     if module_gb is not None:
         # Prefer int if integral, else float
         norm["module_gb"] = int(module_gb) if module_gb.is_integer() else module_gb
 
     # module_ranks
-    ranks_source = (
-        dimm.get("module_ranks")
-        or dimm.get("Ranks")
-        or dimm.get("Rank")
-        or dimm.get("rank")
-        or dimm.get("Module Ranks")
-    )
-    module_ranks = _normalize_module_ranks(ranks_source)
+    module_ranks = _normalize_module_ranks(_first_truthy(dimm, _FIELD_ALIASES["module_ranks"]))
     if module_ranks:
         norm["module_ranks"] = module_ranks
 
     # chip_org
-    chip_org_source = (
-        dimm.get("chip_org")
-        or dimm.get("SDRAM Device Width")
-        or dimm.get("Chip Organization")
-        or dimm.get("Organization")
-    )
-    chip_org = _normalize_chip_org(chip_org_source)
+    chip_org = _normalize_chip_org(_first_truthy(dimm, _FIELD_ALIASES["chip_org"]))
     if chip_org:
         norm["chip_org"] = chip_org
 
     # module_part_number
-    part_number = _extract_first_str(
-        dimm,
-        [
-            "Part Number",
-            "Module Part Number",
-            "module_part_number",
-            "PartNumber",
-            "P/N",
-        ],
-    )
+    part_number = _extract_first_str(dimm, _FIELD_ALIASES["module_part_number"])
     if part_number:
         norm["module_part_number"] = part_number
 
     # sticker / version / IC-specific fields
-    for key in [
-        "gskill_sticker_code",
-        "corsair_version",
-        "crucial_sticker_suffix",
-        "hynix_ic_part_number",
-    ]:
+    for key in _PASSTHROUGH_FIELDS:
         if key in dimm and dimm[key]:
             val = str(dimm[key]).strip()
             if val:
@@ -381,45 +465,33 @@ def normalize_dimm_data(dimm: Dict[str, Any]) -> Dict[str, Any]:
         norm["timings_xmp"] = timings_xmp_str
 
     # timings_jdec / JEDEC timings (minimal normalization)
-    timings_jdec = (
-        dimm.get("timings_jdec")
-        or dimm.get("timings_jedec")
-        or dimm.get("JEDEC Timings")
-    )
+    timings_jdec = _first_truthy(dimm, _FIELD_ALIASES["timings_jdec"])
     if timings_jdec:
         timings_jdec_str = str(timings_jdec).strip()
         if timings_jdec_str:
             norm["timings_jdec"] = timings_jdec_str
 
     # voltage_xmp: retain as string for matching consistency
-    voltage_src = (
-        dimm.get("voltage_xmp")
-        or dimm.get("XMP Voltage")
-        or dimm.get("Voltage XMP")
-    )
+    voltage_src = _first_truthy(dimm, _FIELD_ALIASES["voltage_xmp"])
     if voltage_src is not None:
         if isinstance(voltage_src, (int, float)):
             voltage_norm = str(voltage_src)
         else:
             s = str(voltage_src).strip()
-            m = re.match(r"^(\d+(?:\.\d+)?)", s)
+            m = _RE_LEADING_NUM.match(s)
             voltage_norm = m.group(1) if m else s if s else None
         if voltage_norm:
             norm["voltage_xmp"] = voltage_norm
 
     # voltage_jdec: normalized numeric-like value derived from JEDEC / nominal voltage.
     # This is additive and does not affect existing matching semantics.
-    jedec_voltage_src = (
-        dimm.get("JEDEC_voltage")
-        or dimm.get("Module Nominal Voltage")
-        or dimm.get("Nominal Voltage")
-    )
+    jedec_voltage_src = _first_truthy(dimm, _FIELD_ALIASES["voltage_jdec"])
     if jedec_voltage_src is not None:
         if isinstance(jedec_voltage_src, (int, float)):
             v_norm = float(jedec_voltage_src)
         else:
             s = str(jedec_voltage_src).strip()
-            m = re.match(r"^(\d+(?:\.\d+)?)", s)
+            m = _RE_LEADING_NUM.match(s)
             v_norm = float(m.group(1)) if m else None
         if v_norm is not None:
             norm["voltage_jdec"] = v_norm
@@ -427,152 +499,489 @@ def normalize_dimm_data(dimm: Dict[str, Any]) -> Dict[str, Any]:
     return norm
 
 
-def is_match(dimm: Dict[str, Any], entry: Dict[str, Any]) -> bool:
-    """
-    Determine whether a normalized DIMM record satisfies all constraints in a DB entry.
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
-    Rules:
-    - Only recognized constraint keys participate in matching.
-    - All specified constraints are combined with logical AND.
-    - Unknown keys in entry are ignored for matching.
-    - Comparison is deterministic and side-effect-free.
+
+# DIMM fields compared case-insensitively by the checks below.
+_LOWERED_FIELDS: Tuple[str, ...] = (
+    "manufacturer",
+    "dram_mfg",
+    "module_part_number",
+    "gskill_sticker_code",
+    "crucial_sticker_suffix",
+)
+
+
+# Two module sizes closer than this are treated as equal (in GB).
+_MODULE_GB_TOLERANCE = 1e-6
+
+
+def _lowered_fields(dimm: Dict[str, Any]) -> Dict[str, Any]:
     """
+    Lowercase the case-insensitive DIMM fields (and convert module_gb to a
+    float) once per lookup rather than once per (DIMM, entry) comparison.
+    """
+    lowered: Dict[str, Any] = {}
+    for field in _LOWERED_FIELDS:
+        value = dimm.get(field, "")
+        if not isinstance(value, str):
+            value = str(value)
+        lowered[field] = value.lower()
+    module_gb = dimm.get("module_gb")
+    lowered["module_gb"] = None if module_gb is None else _as_float(module_gb)
+    return lowered
+
+
+# Per-constraint checks. Each check receives the DIMM, its lowered fields and
+# the entry value as prepared by the paired "prepare" function, so constant
+# work on the entry side (str(), lower(), float()) can be done once per entry
+# instead of per DIMM.
+
+def _check_generation(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: Any) -> bool:
     # generation: exact match
-    if "generation" in entry:
-        if dimm.get("generation") != entry["generation"]:
-            return False
+    return dimm.get("generation") == expected
 
+
+def _check_manufacturer(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # manufacturer: substring or exact match (case-insensitive)
-    if "manufacturer" in entry:
-        expected = str(entry["manufacturer"]).lower()
-        actual = str(dimm.get("manufacturer", "")).lower()
-        if expected not in actual:
-            return False
+    return expected in lowered["manufacturer"]
+
 
+def _check_dram_mfg(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # dram_mfg: exact, case-insensitive
-    if "dram_mfg" in entry:
-        expected = str(entry["dram_mfg"]).lower()
-        actual = dimm.get("dram_mfg")
-        if not isinstance(actual, str) or actual.lower() != expected:
-            return False
+    return isinstance(dimm.get("dram_mfg"), str) and lowered["dram_mfg"] == expected
+
+
+def _check_module_gb(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: Optional[float]) -> bool:
+    # module_gb: numeric equality (tolerate int/float and float rounding)
+    actual = lowered["module_gb"]
+    if actual is None or expected is None:
+        return False
+    return actual == expected or abs(actual - expected) <= _MODULE_GB_TOLERANCE
 
-    # module_gb: numeric equality (tolerate int/float)
-    if "module_gb" in entry:
-        expected = entry["module_gb"]
-        actual = dimm.get("module_gb")
-        if actual is None:
-            return False
-        try:
-            if float(actual) != float(expected):
-                return False
-        except (TypeError, ValueError):
-            return False
 
+def _check_module_ranks(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: Any) -> bool:
     # module_ranks: exact
-    if "module_ranks" in entry:
-        if dimm.get("module_ranks") != entry["module_ranks"]:
-            return False
+    return dimm.get("module_ranks") == expected
+
 
+def _check_chip_org(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: Any) -> bool:
     # chip_org: exact
-    if "chip_org" in entry:
-        if dimm.get("chip_org") != entry["chip_org"]:
-            return False
+    return dimm.get("chip_org") == expected
+
 
+def _check_part_number_contains(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # part_number_contains: case-insensitive substring in module_part_number
-    if "part_number_contains" in entry:
-        expected = str(entry["part_number_contains"]).lower()
-        actual = str(dimm.get("module_part_number", "")).lower()
-        if expected not in actual:
-            return False
+    return expected in lowered["module_part_number"]
 
+
+def _check_part_number_exact(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # part_number_exact: case-insensitive equality
-    if "part_number_exact" in entry:
-        expected = str(entry["part_number_exact"]).lower()
-        actual = dimm.get("module_part_number")
-        if not isinstance(actual, str) or actual.lower() != expected:
-            return False
+    return (
+        isinstance(dimm.get("module_part_number"), str)
+        and lowered["module_part_number"] == expected
+    )
+
 
+def _check_timings_xmp(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # timings_xmp: exact or substring match vs dimm["timings_xmp"]
-    if "timings_xmp" in entry:
-        expected = str(entry["timings_xmp"])
-        actual = str(dimm.get("timings_xmp", ""))
-        if not (actual == expected or expected in actual):
-            return False
+    actual = dimm.get("timings_xmp", "")
+    if not isinstance(actual, str):
+        actual = str(actual)
+    return expected in actual
 
+
+def _check_timings_jdec(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # timings_jdec: exact match vs dimm["timings_jdec"]
-    if "timings_jdec" in entry:
-        expected = str(entry["timings_jdec"])
-        actual = dimm.get("timings_jdec")
-        if not isinstance(actual, str) or actual != expected:
-            return False
+    actual = dimm.get("timings_jdec")
+    return isinstance(actual, str) and actual == expected
 
+
+def _check_voltage_xmp(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # voltage_xmp: compare as strings
-    if "voltage_xmp" in entry:
-        expected = str(entry["voltage_xmp"])
-        actual = dimm.get("voltage_xmp")
-        if actual is None:
-            return False
-        if str(actual) != expected:
-            return False
+    actual = dimm.get("voltage_xmp")
+    if isinstance(actual, str):
+        return actual == expected
+    return actual is not None and str(actual) == expected
 
-    # corsair_version:
-    if "corsair_version" in entry:
-        expected = str(entry["corsair_version"])
-        actual = str(dimm.get("corsair_version", ""))
-        if expected.endswith("."):
-            # prefix semantics: DB value like "3." means versions starting with "3."
-            if not actual.startswith(expected):
-                return False
-        else:
-            if actual != expected:
-                return False
 
+def _check_corsair_version(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
+    actual = dimm.get("corsair_version", "")
+    if not isinstance(actual, str):
+        actual = str(actual)
+    if expected.endswith("."):
+        # prefix semantics: DB value like "3." means versions starting with "3."
+        return actual.startswith(expected)
+    return actual == expected
+
+
+def _check_gskill_sticker_code(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # gskill_sticker_code: entry substring must appear (case-insensitive)
-    if "gskill_sticker_code" in entry:
-        expected = str(entry["gskill_sticker_code"]).lower()
-        actual = str(dimm.get("gskill_sticker_code", "")).lower()
-        if expected not in actual:
-            return False
+    return expected in lowered["gskill_sticker_code"]
 
+
+def _check_crucial_sticker_suffix(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
     # crucial_sticker_suffix: exact, case-insensitive
-    if "crucial_sticker_suffix" in entry:
-        expected = str(entry["crucial_sticker_suffix"]).lower()
-        actual = dimm.get("crucial_sticker_suffix")
-        if not isinstance(actual, str) or actual.lower() != expected:
-            return False
+    return (
+        isinstance(dimm.get("crucial_sticker_suffix"), str)
+        and lowered["crucial_sticker_suffix"] == expected
+    )
+
+
+def _hynix_ic_8th(dimm: Dict[str, Any]) -> Optional[str]:
+    """
+    Uppercased 8th character (index 7) of the DIMM's Hynix IC part number,
+    or None if there is no usable IC string.
+    """
+    # Support both normalized key and raw SPD-like key.
+    ic = (
+        dimm.get("hynix_ic_part_number")
+        or dimm.get("Hynix IC Part Number")
+        or dimm.get("hynix_ic_pn")
+    )
+    if not isinstance(ic, str) or len(ic) < 8:
+        return None
+    # Uppercase to tolerate database vs SPD casing.
+    return ic[7].upper()
+
+
+def _check_hynix_ic_parse_8th(dimm: Dict[str, Any], lowered: Dict[str, Any], expected: str) -> bool:
+    # hynix_ic_parse_8th: check 8th char of hynix_ic_part_number (case-insensitive).
+    # If we don't have a usable IC string, this constraint fails.
+    return _hynix_ic_8th(dimm) == expected
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _lower(value: Any) -> str:
+    return str(value).lower()
+
+
+def _upper(value: Any) -> str:
+    return str(value).upper()
+
+
+# Recognized constraint keys: (key, prepare, check). Constraints are ANDed, so
+# order only affects speed. index_database() reorders them by selectivity
+# (see _constraints_by_selectivity()); this cheap-exact-first, substrings-last
+# order is only the default for unindexed lookups and the tie-breaker there.
+_CONSTRAINTS: Tuple[Tuple[str, Any, Any], ...] = (
+    ("generation", _identity, _check_generation),
+    ("module_ranks", _identity, _check_module_ranks),
+    ("chip_org", _identity, _check_chip_org),
+    ("module_gb", _as_float, _check_module_gb),
+    ("dram_mfg", _lower, _check_dram_mfg),
+    ("timings_jdec", str, _check_timings_jdec),
+    ("voltage_xmp", str, _check_voltage_xmp),
+    ("corsair_version", str, _check_corsair_version),
+    ("hynix_ic_parse_8th", _upper, _check_hynix_ic_parse_8th),
+    ("part_number_exact", _lower, _check_part_number_exact),
+    ("crucial_sticker_suffix", _lower, _check_crucial_sticker_suffix),
+    ("timings_xmp", str, _check_timings_xmp),
+    ("manufacturer", _lower, _check_manufacturer),
+    ("part_number_contains", _lower, _check_part_number_contains),
+    ("gskill_sticker_code", _lower, _check_gskill_sticker_code),
+)
 
-    # hynix_ic_parse_8th: check 8th char of hynix_ic_part_number (case-insensitive)
-    if "hynix_ic_parse_8th" in entry:
-        expected = str(entry["hynix_ic_parse_8th"]).upper()
-        # Support both normalized key and raw SPD-like key.
-        ic = (
-            dimm.get("hynix_ic_part_number")
-            or dimm.get("Hynix IC Part Number")
-            or dimm.get("hynix_ic_pn")
-        )
-        # If we don't have a usable IC string, this constraint fails.
-        if not isinstance(ic, str) or len(ic) < 8:
-            return False
-        # Compare the 8th character (index 7) of the IC string) in a
-        # case-insensitive manner to tolerate database vs SPD casing.
-        if ic[7].upper() != expected:
-            return False
 
+def _compile_entry(
+    entry: Dict[str, Any],
+    constraints: Tuple[Tuple[str, Any, Any], ...] = _CONSTRAINTS,
+) -> Tuple[Tuple[Any, Any], ...]:
+    """
+    Reduce a DB entry to the (check, prepared_value) pairs it actually uses,
+    in the order given by constraints.
+    """
+    return tuple(
+        (check, prepare(entry[key]))
+        for key, prepare, check in constraints
+        if key in entry
+    )
+
+
+def _constraints_by_selectivity(db: List[Dict[str, Any]]) -> Tuple[Tuple[str, Any, Any], ...]:
+    """
+    Order constraints by how many distinct values they take across db.
+
+    A constraint with many distinct values is more likely to reject a given
+    DIMM, so it is checked first. Ties keep the static _CONSTRAINTS order.
+    """
+    distinct: Dict[str, set] = {key: set() for key, _, _ in _CONSTRAINTS}
+    for entry in db:
+        for key in distinct:
+            if key in entry:
+                distinct[key].add(repr(entry[key]))
+    return tuple(sorted(_CONSTRAINTS, key=lambda c: -len(distinct[c[0]])))
+
+
+def _match_compiled(
+    dimm: Dict[str, Any],
+    lowered: Dict[str, Any],
+    checks: Tuple[Tuple[Any, Any], ...],
+) -> bool:
+    for check, expected in checks:
+        if not check(dimm, lowered, expected):
+            return False
     return True
 
 
-def find_die_type(dimm: Dict[str, Any], db: List[Dict[str, Any]]) -> Tuple[str, Optional[str]]:
+def is_match(dimm: Dict[str, Any], entry: Dict[str, Any]) -> bool:
+    """
+    Determine whether a normalized DIMM record satisfies all constraints in a DB entry.
+
+    Rules:
+    - Only recognized constraint keys participate in matching.
+    - All specified constraints are combined with logical AND.
+    - Unknown keys in entry are ignored for matching.
+    - Comparison is deterministic and side-effect-free.
+    """
+    return _match_compiled(dimm, _lowered_fields(dimm), _compile_entry(entry))
+
+
+def _bucket_key(generation: Any, dram_mfg: Any) -> Tuple[Any, Optional[str]]:
+    # dram_mfg is compared case-insensitively by is_match, so bucket on the
+    # lowered form; generation is an exact match and is used as-is.
+    return generation, (str(dram_mfg).lower() if dram_mfg is not None else None)
+
+
+# Substring-style constraints (entry value must appear in the DIMM field,
+# case-insensitively) that can be prefiltered with a single combined regex.
+_SUBSTRING_CONSTRAINTS: Dict[str, str] = {
+    "manufacturer": "manufacturer",
+    "part_number_contains": "module_part_number",
+    "gskill_sticker_code": "gskill_sticker_code",
+}
+
+
+def _build_substring_prefilter(values: List[str]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile lowercase substring values into one alternation regex, grouped by
+    leading character so the engine can dispatch on the first literal.
+
+    Returns None if any value is empty (it would match every DIMM, so the
+    prefilter could never exclude anything).
+    """
+    groups: Dict[str, List[str]] = {}
+    for value in values:
+        if not value:
+            return None
+        groups.setdefault(value[0], []).append(value[1:])
+    pattern = "|".join(
+        re.escape(first) + "(?:" + "|".join(re.escape(rest) for rest in sorted(set(rests))) + ")"
+        for first, rests in groups.items()
+    )
+    return re.compile(pattern)
+
+
+def index_database(db: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a lookup index over a loaded database for use with find_die_type().
+
+    Entries are bucketed by their (generation, dram_mfg) constraints. Entries
+    that do not constrain one of those fields are stored under None for it,
+    so they are considered for every DIMM. Buckets hold positions into db,
+    which keeps the priority ordering from load_database intact.
+
+    Substring constraints (manufacturer, part_number_contains,
+    gskill_sticker_code) additionally get a combined prefilter regex: if a
+    DIMM's field matches none of the DB values for that constraint, every
+    entry carrying it is skipped without calling is_match(). Likewise,
+    hynix_ic_parse_8th entries are keyed by their expected character so only
+    those matching the DIMM's IC part number are considered.
+
+    The index only narrows the candidate set; is_match() remains the final
+    arbiter, so results are identical to scanning db directly.
+
+    Returns:
+        Dict with:
+        - "buckets": {(generation, dram_mfg_lower): [db positions]}
+        - "prefilters": {constraint: (dimm_field, pattern, positions)}
+        - "hynix_8th": (all positions with hynix_ic_parse_8th,
+                        {expected char: positions})
+        - "compiled": per-entry tuples of active (check, value) pairs,
+          aligned with db positions and ordered most-selective first
+        - "results": find_die_type() memo keyed by DIMM fingerprint
+        - "sorted": True when db is in descending priority order (as
+          returned by load_database), which lets find_die_type() stop
+          scanning once it is past the best-matching priority
+    """
+    buckets: Dict[Tuple[Any, Optional[str]], List[int]] = {}
+    substring_values: Dict[str, List[str]] = {key: [] for key in _SUBSTRING_CONSTRAINTS}
+    substring_positions: Dict[str, List[int]] = {key: [] for key in _SUBSTRING_CONSTRAINTS}
+
+    for pos, entry in enumerate(db):
+        key = _bucket_key(entry.get("generation"), entry.get("dram_mfg"))
+        buckets.setdefault(key, []).append(pos)
+        for constraint in _SUBSTRING_CONSTRAINTS:
+            if constraint in entry:
+                substring_values[constraint].append(str(entry[constraint]).lower())
+                substring_positions[constraint].append(pos)
+
+    hynix_by_char: Dict[str, set] = {}
+    for pos, entry in enumerate(db):
+        if "hynix_ic_parse_8th" in entry:
+            hynix_by_char.setdefault(_upper(entry["hynix_ic_parse_8th"]), set()).add(pos)
+
+    prefilters: Dict[str, Tuple[str, "re.Pattern[str]", frozenset]] = {}
+    for constraint, field in _SUBSTRING_CONSTRAINTS.items():
+        if not substring_values[constraint]:
+            continue
+        pattern = _build_substring_prefilter(substring_values[constraint])
+        if pattern is not None:
+            prefilters[constraint] = (field, pattern, frozenset(substring_positions[constraint]))
+
+    constraints = _constraints_by_selectivity(db)
+    return {
+        "buckets": buckets,
+        "prefilters": prefilters,
+        "hynix_8th": (
+            frozenset().union(*hynix_by_char.values()),
+            {char: frozenset(positions) for char, positions in hynix_by_char.items()},
+        ),
+        "compiled": [_compile_entry(entry, constraints) for entry in db],
+        "results": {},
+        "sorted": all(
+            db[pos]["priority"] >= db[pos + 1]["priority"] for pos in range(len(db) - 1)
+        ),
+    }
+
+
+# Every DIMM field read by the constraint checks; a lookup result depends only
+# on these, so they form the memoization fingerprint.
+_MATCH_FIELDS: Tuple[str, ...] = (
+    "generation",
+    "manufacturer",
+    "dram_mfg",
+    "module_gb",
+    "module_ranks",
+    "chip_org",
+    "module_part_number",
+    "timings_xmp",
+    "timings_jdec",
+    "voltage_xmp",
+    "corsair_version",
+    "gskill_sticker_code",
+    "crucial_sticker_suffix",
+    "hynix_ic_part_number",
+    "Hynix IC Part Number",
+    "hynix_ic_pn",
+)
+
+_MISSING = object()
+
+
+def _fingerprint(
+    dimm: Dict[str, Any], fields: Tuple[str, ...] = _MATCH_FIELDS
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Hashable key over the given DIMM fields, or None if a value is
+    unhashable. Types are included since checks like str() distinguish 1
+    from 1.0, and missing keys are distinct from None for the same reason.
+    """
+    fp = []
+    for field in fields:
+        val = dimm.get(field, _MISSING)
+        fp.append(val.__class__)
+        fp.append(val)
+    key = tuple(fp)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Every DIMM key read by normalize_dimm_data().
+_NORMALIZE_INPUT_KEYS: Tuple[str, ...] = tuple(
+    key for aliases in _FIELD_ALIASES.values() for key in aliases
+) + _PASSTHROUGH_FIELDS + ("timings_xmp",)
+
+
+def normalize_dimms_batch(dimms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize a list of DIMMs, returning one normalized dict per input.
+
+    DIMMs whose normalization inputs are identical (typically every module of
+    a matched kit, which differ only by slot) are normalized once and the
+    result copied. Output is identical to calling normalize_dimm_data() on
+    each DIMM.
+    """
+    seen: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    out: List[Dict[str, Any]] = []
+    for dimm in dimms:
+        fingerprint = _fingerprint(dimm, _NORMALIZE_INPUT_KEYS)
+        if fingerprint is None:
+            out.append(normalize_dimm_data(dimm))
+            continue
+        norm = seen.get(fingerprint)
+        if norm is None:
+            norm = normalize_dimm_data(dimm)
+            seen[fingerprint] = norm
+        out.append(dict(norm))
+    return out
+
+
+def _candidate_positions(
+    dimm: Dict[str, Any], lowered: Dict[str, Any], index: Dict[str, Any]
+) -> List[int]:
+    buckets = index["buckets"]
+    generation = dimm.get("generation")
+    dram_mfg = dimm.get("dram_mfg")
+    # is_match only accepts a string dram_mfg, so other values cannot satisfy
+    # an entry that constrains it.
+    mfg_options: List[Any] = [None]
+    if isinstance(dram_mfg, str):
+        mfg_options.append(dram_mfg)
+
+    positions: List[int] = []
+    for gen in {generation, None}:
+        for mfg in mfg_options:
+            positions.extend(buckets.get(_bucket_key(gen, mfg), ()))
+
+    # Drop entries whose substring constraint cannot match any DB value.
+    excluded: set = set()
+    for field, pattern, constrained in index["prefilters"].values():
+        if not pattern.search(lowered[field]):
+            excluded |= constrained
+
+    # Hynix 8th-char entries: keep only those expecting this DIMM's char.
+    hynix_all, hynix_by_char = index["hynix_8th"]
+    if hynix_all:
+        excluded |= hynix_all - hynix_by_char.get(_hynix_ic_8th(dimm), frozenset())
+
+    positions.sort()
+    return [pos for pos in positions if pos not in excluded]
+
+
+def find_die_type(
+    dimm: Dict[str, Any],
+    db: List[Dict[str, Any]],
+    index: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, Optional[str]]:
     """
     Given a normalized DIMM record and a loaded database, determine the die_type.
 
+    If an index built by index_database(db) is supplied, only entries whose
+    generation/dram_mfg constraints could match the DIMM are evaluated, and
+    results are memoized in the index so identical modules (e.g. a matched
+    kit) are only resolved once.
+
     Selection algorithm:
-    - Iterate entries in priority-sorted order.
+    - Iterate entries in db order; db need not be sorted.
     - Collect matches at the highest encountered priority:
       * If an entry does not match, skip it.
-      * If first match, set best_priority and start best_matches list.
+      * If first match, or a match with higher priority, reset best_priority
+        and start a new best_matches list.
       * If another match with same priority, append.
-      * If entry has lower priority than current best_priority, it cannot
-        supersede current matches; continue scanning without changing best.
+      * When the index reports db as priority-sorted (as returned by
+        load_database), scanning stops at the first entry below
+        best_priority, since no later entry can supersede current matches.
     - Resolution:
       * If no matches:
           ("Unknown", "No heuristic match found in database.")
@@ -585,22 +994,55 @@ def find_die_type(dimm: Dict[str, Any], db: List[Dict[str, Any]]) -> Tuple[str,
                 ("Ambiguous",
                  "Multiple matching heuristics at same priority: <sorted die_types>")
     """
+    if index is None:
+        return _resolve_die_type(dimm, db, None)
+
+    fingerprint = _fingerprint(dimm)
+    if fingerprint is None:
+        return _resolve_die_type(dimm, db, index)
+
+    results = index["results"]
+    result = results.get(fingerprint)
+    if result is None:
+        result = _resolve_die_type(dimm, db, index)
+        results[fingerprint] = result
+    return result
+
+
+def _resolve_die_type(
+    dimm: Dict[str, Any],
+    db: List[Dict[str, Any]],
+    index: Optional[Dict[str, Any]],
+) -> Tuple[str, Optional[str]]:
     best_matches: List[Dict[str, Any]] = []
     best_priority: Optional[int] = None
 
-    for entry in db:
-        if not is_match(dimm, entry):
-            continue
+    lowered = _lowered_fields(dimm)
+    presorted = index is not None and index["sorted"]
+    if index is not None:
+        compiled = index["compiled"]
+        candidates = (
+            (db[pos], compiled[pos]) for pos in _candidate_positions(dimm, lowered, index)
+        )
+    else:
+        candidates = ((entry, _compile_entry(entry)) for entry in db)
 
+    for entry, checks in candidates:
         priority = entry["priority"]
 
+        # In a priority-sorted db, past the best band nothing further can
+        # change the result.
+        if presorted and best_priority is not None and priority < best_priority:
+            break
+
+        if not _match_compiled(dimm, lowered, checks):
+            continue
+
         if best_priority is None or priority > best_priority:
             best_priority = priority
             best_matches = [entry]
         elif priority == best_priority:
             best_matches.append(entry)
-        # If priority < best_priority: ignore for selection, but continue loop to
-        # preserve determinism / not early-return.
 
     if not best_matches:
         return "Unknown", "No heuristic match found in database."
@@ -125,9 +125,10 @@ def main() -> None:
     1. Parse arguments.
     2. Determine non_interactive.
     3. Check root privileges.
-    4. Check dependencies and prompt as needed.
-    5. Load kernel modules (best-effort, non-fatal).
-    6. Discover SMBus/I2C busses and SPD addresses (non-fatal if none).
+    4. Check dependencies and prompt as needed (skipped with --test-data).
+    5. Load kernel modules (best-effort, non-fatal; skipped with --test-data).
+    6. Discover SMBus/I2C busses and SPD addresses (non-fatal if none; skipped
+       with --test-data).
     7. Run decode-dimms and capture outputs.
     8. Parse side-by-side output into DIMM dictionaries.
     9. Load die heuristic database.
@@ -173,16 +174,21 @@ def main() -> None:
     }
 
     # Unified dependency handling with autonomous system-native installation.
-    check_and_install_dependencies(
-        requested_features=requested_features,
-        interactive=not non_interactive,
-    )
+    # Skipped with test data: no hardware is scanned, and a missing Textual
+    # already falls back to summary output in launch_tui().
+    if not getattr(args, "test_data", False):
+        check_and_install_dependencies(
+            requested_features=requested_features,
+            interactive=not non_interactive,
+        )
 
     # Execute the system scan
     try:
         dimms, raw_individual = perform_system_scan(
             test_data_mode=getattr(args, "test_data", False),
-            fail_on_no_smbus=non_interactive
+            fail_on_no_smbus=non_interactive,
+            # Only --full and the TUI display raw SPD blocks.
+            raw_blocks=not (args.json or args.summary),
         )
     except SmbusNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -198,18 +204,22 @@ def main() -> None:
             dimms = []
             raw_individual = {}
 
-    # If we are in an interactive/TUI-capable flow (no explicit non-interactive
-    # output mode), run lootbox prompts and re-resolve using enriched data.
+    # perform_system_scan() returns DIMMs already normalized and resolved, so
+    # --json/--summary/--full output them as-is. Only in an interactive/TUI
+    # flow are lootbox prompts run, and only DIMMs that received a code are
+    # re-resolved using the enriched data.
     interactive_lootbox = (not non_interactive) and not (
         args.json or args.summary or args.full
     )
-    if interactive_lootbox:
-        # Load DB for re-resolution
+    enriched = apply_lootbox_prompts(dimms, interactive=True) if interactive_lootbox else []
+    if enriched:
+        # Load DB for re-resolution (cached from the scan above)
         db = load_die_database()
-        apply_lootbox_prompts(dimms, interactive=True)
-        for dimm in dimms:
-            dimm.update(RamSleuth_DB.normalize_dimm_data(dimm))
-            die_type, notes = RamSleuth_DB.find_die_type(dimm, db)
+        db_index = RamSleuth_DB.index_database(db)
+        targets = [dimms[idx] for idx in enriched]
+        for dimm, norm in zip(targets, RamSleuth_DB.normalize_dimms_batch(targets)):
+            dimm.update(norm)
+            die_type, notes = RamSleuth_DB.find_die_type(dimm, db, db_index)
             dimm["die_type"] = die_type
             if notes:
                 dimm["notes"] = notes
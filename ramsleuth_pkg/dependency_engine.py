@@ -14,6 +14,7 @@ import shutil
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 
@@ -100,6 +101,24 @@ SYSTEM_PACKAGE_MAP: Dict[str, Dict[str, List[str]]] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _distro_package_map(distro_id: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Project SYSTEM_PACKAGE_MAP onto a single distribution.
+    
+    Args:
+        distro_id: Internal distribution ID from detect_distribution()
+        
+    Returns:
+        Flat tool -> system package names mapping (empty tuple when the
+        distribution has no entry). Built once per distribution; read-only.
+    """
+    return {
+        tool: tuple(per_distro.get(distro_id, ()))
+        for tool, per_distro in SYSTEM_PACKAGE_MAP.items()
+    }
+
+
 # ============================================================================
 # DISTRIBUTION DETECTION
 # ============================================================================
@@ -231,10 +250,15 @@ def detect_distribution() -> Dict[str, Any]:
 # DEPENDENCY CHECKING
 # ============================================================================
 
+@lru_cache(maxsize=None)
 def check_tool_available(tool_name: str) -> bool:
     """
     Robust tool checking using multiple methods.
     
+    Results are cached for the rest of the run (a missing tool would
+    otherwise cost two subprocess attempts per check); auto_install_dependencies()
+    resets the cache once its install command returns, whether or not it succeeded.
+
     Args:
         tool_name: Name of the tool to check
         
@@ -274,10 +298,13 @@ def check_tool_available(tool_name: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
 def check_python_package(package_name: str) -> bool:
     """
     Check if a Python package is available using importlib.
     
+    Results are cached like check_tool_available().
+    
     Args:
         package_name: Name of the Python package
         
@@ -291,6 +318,13 @@ def check_python_package(package_name: str) -> bool:
         return False
 
 
+def _reset_availability_caches() -> None:
+    """Forget cached tool/package probes, e.g. after an installation attempt."""
+    check_tool_available.cache_clear()
+    check_python_package.cache_clear()
+    importlib.invalidate_caches()
+
+
 def check_dependency(package_name: str) -> bool:
     """
     Check if a dependency is satisfied.
@@ -386,11 +420,10 @@ def construct_install_command(packages: List[str], distro_info: Dict[str, Any])
         return ""
     
     # Get system package names for the detected distribution
+    package_map = _distro_package_map(distro_id)
     system_packages = []
     for package in packages:
-        if package in SYSTEM_PACKAGE_MAP:
-            distro_packages = SYSTEM_PACKAGE_MAP[package].get(distro_id, [])
-            system_packages.extend(distro_packages)
+        system_packages.extend(package_map.get(package, ()))
     
     if not system_packages:
         return ""
@@ -456,6 +489,10 @@ def auto_install_dependencies(packages: List[str], distro_info: Dict[str, Any])
     except Exception as e:
         print(f"✗ Installation failed with exception: {e}")
         return False
+    finally:
+        # Even a failed or partial install may have changed what is present,
+        # so earlier availability probes are stale.
+        _reset_availability_caches()
 
 
 # ============================================================================
@@ -551,11 +588,10 @@ def check_and_install_dependencies(interactive: bool, requested_features: Dict[s
         print("Error: Missing required dependencies.", file=sys.stderr)
         
         if missing_dependencies["system"]:
+            package_map = _distro_package_map(distro_info["id"])
             system_packages = []
             for tool in missing_dependencies["system"]:
-                if tool in SYSTEM_PACKAGE_MAP:
-                    packages = SYSTEM_PACKAGE_MAP[tool].get(distro_info["id"], [])
-                    system_packages.extend(packages)
+                system_packages.extend(package_map.get(tool, ()))
             
             if system_packages:
                 install_cmd = construct_install_command(missing_dependencies["system"], distro_info)
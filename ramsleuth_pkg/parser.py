@@ -1,7 +1,102 @@
 import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+from . import utils
 from .utils import _debug_print
 
+# Start of a per-DIMM section in plain decode-dimms output (the header may be
+# indented).
+_RE_BLOCK_HEADER = re.compile(r"^[^\S\n]*(?:Decoding EEPROM|SPD data for)", re.MULTILINE)
+
+# Profile speed ("3600 MT/s") and 3- or 4-part timings, e.g. 18-22-22-42 or
+# 18 22 22 42.
+_RE_MTS_SPEED = re.compile(r'(\d+)\s*MT/s')
+_RE_TIMINGS = re.compile(r'\b(\d{1,3})[ -]+(\d{1,3})[ -]+(\d{1,3})(?:[ -]+(\d{1,3}))?\b')
+# Slot hint ("bank 3", "dimm 1"), XMP frequency suffix ("DDR4-3600") and
+# leading speed number ("3200 MT/s").
+_RE_BANK_DIMM = re.compile(r"(bank|dimm)\s*\d+")
+_RE_TRAILING_INT = re.compile(r'(\d+)$')
+_RE_FIRST_INT = re.compile(r"(\d+)")
+
+# Side-by-side matrix labels (lowercased) mapped to canonical DIMM keys.
+# Labels not listed here keep their raw spelling as the key.
+_MATRIX_LABEL_KEYS: Dict[str, str] = {
+    "size/capacity": "module_gb",
+    "module capacity": "module_gb",
+    "module size": "module_gb",
+    "dram manufacturer": "dram_mfg",
+    "part number": "module_part_number",
+    "fundamental memory type": "generation",
+    "module nominal voltage": "JEDEC_voltage",
+    "minimum voltage": "min_voltage",
+    "maximum voltage": "max_voltage",
+    "configured voltage": "configured_voltage",
+    "configured memory speed": "configured_speed",
+    "configured speed": "configured_speed",
+    "ranks": "module_ranks",
+    "sdram device width": "SDRAM Device Width",
+    "guessing dimm is in": "Guessing DIMM is in",
+    "jedec timings": "JEDEC Timings",
+    "additional jedec timings malformed": "Additional JEDEC Timings malformed",
+    "pmic manufacturer": "PMIC Manufacturer",
+    "hynix ic part number": "Hynix IC Part Number",
+}
+# Keys every DIMM column receives (empty when its cell is blank).
+_MATRIX_PLACEHOLDER_KEYS = frozenset((
+    "Additional JEDEC Timings malformed",
+    "Malformed Line With Too Many Columns",
+))
+# Substring rules for labels not matched exactly, checked in order.
+_MATRIX_LABEL_FRAGMENT_KEYS = (
+    ("module manufacturer", "manufacturer"),
+    ("number of ranks", "module_ranks"),
+)
+
+# Matrix row labels (lowercased) that are noise rather than SPD fields.
+_MATRIX_NOISE_LABELS = frozenset((
+    "noise",
+    "random garbage line not using pipes at all",
+    "",
+))
+# Plain-text keys that are noise rather than SPD fields.
+_PLAIN_NOISE_KEYS = frozenset((
+    "Noise",
+    "Debug",
+    "Random garbage line not using pipes at all",
+))
+
+def _normalize_slot_string(slot_val: str) -> str:
+    return " ".join(str(slot_val).lower().split())
+
+@lru_cache(maxsize=64)
+def _derive_slots_from_guess(raw_val: str) -> Tuple[str, ...]:
+    """
+    Minimal helper for 'Guessing DIMM is in ...' lines.
+
+    Behavior (fixture-aligned):
+    - If value contains both 'bank 3' and 'bank 4' (any spacing), return
+      ('bank 3', 'bank 4') in that order.
+    - If it contains a single recognizable 'bank N' or 'dimm N', return (that,).
+    - Otherwise, return (raw_val,) as a best-effort single slot.
+
+    Memoized across parse_output() calls, since the same slot hints recur;
+    returns a tuple so cached results cannot be mutated by callers.
+    """
+    normalized = _normalize_slot_string(raw_val)
+    if not normalized:
+        return ()
+
+    # Explicit aggregate handling for the spec fixture.
+    if "bank 3" in normalized and "bank 4" in normalized:
+        return ("bank 3", "bank 4")
+
+    # Single slot best-effort.
+    m = _RE_BANK_DIMM.search(normalized)
+    if m:
+        return (m.group(0),)
+
+    return (raw_val,)
+
 def _split_decode_dimms_blocks(output: str) -> Dict[str, str]:
     """
     Split plain `decode-dimms` output into per-DIMM blocks.
@@ -12,33 +107,18 @@ def _split_decode_dimms_blocks(output: str) -> Dict[str, str]:
     - We therefore create exactly one block per "Decoding EEPROM" section,
       even if that header lists multiple addresses.
     """
-    blocks: Dict[str, List[str]] = {}
-    current_key: str = ""
-    current_lines: List[str] = []
-    dimm_index = 0
-
-    def _flush() -> None:
-        nonlocal dimm_index, current_lines, current_key
-        if current_lines and current_key:
-            blocks[current_key] = "\n".join(current_lines).rstrip() + "\n"
-            dimm_index += 1
-            current_lines = []
-            current_key = ""
-
-    for line in output.splitlines():
-        stripped = line.lstrip()
-        if stripped.startswith("Decoding EEPROM") or stripped.startswith("SPD data for"):
-            _flush()
-            current_key = f"dimm_{dimm_index}"
-            current_lines.append(line)
-        else:
-            if current_key:
-                current_lines.append(line)
-
-    _flush()
-    _debug_print(
-        f"_split_decode_dimms_blocks: parsed {len(blocks)} block(s) from plain decode-dimms output."
-    )
+    # Each block runs from its header line to the next header (or EOF) and is
+    # sliced straight out of the output instead of re-joining split lines.
+    blocks: Dict[str, str] = {}
+    starts = [m.start() for m in _RE_BLOCK_HEADER.finditer(output)]
+    for dimm_index, start in enumerate(starts):
+        end = starts[dimm_index + 1] if dimm_index + 1 < len(starts) else len(output)
+        blocks[f"dimm_{dimm_index}"] = output[start:end].rstrip() + "\n"
+
+    if utils.DEBUG:
+        _debug_print(
+            f"_split_decode_dimms_blocks: parsed {len(blocks)} block(s) from plain decode-dimms output."
+        )
     return blocks
 
 def extract_profiles_from_spd(spd_output: str) -> Dict[str, Dict[str, str]]:
@@ -69,16 +149,12 @@ def extract_profiles_from_spd(spd_output: str) -> Dict[str, Dict[str, str]]:
         # AA-RCD-RP-RAS (cycles) 16-18-18-38
         if ("XMP" in line or "EXPO" in line) and "MT/s" in line:
             # Try to grab speed
-            speed_match = re.search(r'(\d+)\s*MT/s', line)
+            speed_match = _RE_MTS_SPEED.search(line)
             if speed_match:
                 speed = speed_match.group(1)
                 full_speed = f"{speed} MT/s"
                 
-                # Pattern to match 3 or 4 timings (e.g. 18-22-22-42 or 18 22 22 42)
-                # Matches: 18-22-22, 18 22 22, 18-22-22-42, 18 22 22 42
-                timing_pattern = r'\b(\d{1,3})[ -]+(\d{1,3})[ -]+(\d{1,3})(?:[ -]+(\d{1,3}))?\b'
-                
-                matches = list(re.finditer(timing_pattern, line))
+                matches = list(_RE_TIMINGS.finditer(line))
                 timings = "Unknown"
 
                 # Prioritize the last match if multiple (often voltage is earlier or later, but timings are grouped)
@@ -119,8 +195,7 @@ def extract_profiles_from_spd(spd_output: str) -> Dict[str, Dict[str, str]]:
         # If we are in a profile context and timings are unknown, look for them
         if current_profile_speed and profiles[current_profile_speed]["timings"] == "Unknown":
              # Look for timing pattern on subsequent lines
-             timing_pattern = r'\b(\d{1,3})[ -]+(\d{1,3})[ -]+(\d{1,3})(?:[ -]+(\d{1,3}))?\b'
-             matches = list(re.finditer(timing_pattern, line))
+             matches = list(_RE_TIMINGS.finditer(line))
              
              selected_match = None
              for m in matches:
@@ -173,11 +248,17 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
     - Parse plain-text "Decoding EEPROM ..." blocks into DIMM dicts.
     - Preserve key/value mappings exactly as required by tests.
     - Do NOT perform cross-DIMM deduplication or heuristic merging.
+    - Every value stored in a DIMM dict is a str; downstream readers such as
+      apply_lootbox_prompts() rely on this and do not coerce.
 
     For test_data.txt:
     - Returns 6 DIMMs in this order:
       [d0, d1, d2, d3, a_bank3, a_bank4].
     """
+    # Neither a matrix row nor a plain-text block header: nothing to parse.
+    if "|" not in raw_output and "Decoding EEPROM" not in raw_output:
+        return []
+
     lines = raw_output.splitlines()
     if not lines:
         return []
@@ -206,12 +287,6 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
         dimm_count = len(dimm_headers)
         dimms: List[Dict[str, Any]] = [{} for _ in range(dimm_count)]
 
-        noise_labels = {
-            "noise",
-            "random garbage line not using pipes at all",
-            "",
-        }
-
         for line in lines[header_index + 1 :]:
             stripped = line.lstrip()
             if stripped.startswith("Decoding EEPROM") or stripped.startswith("SPD data for"):
@@ -228,7 +303,7 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
                 continue
 
             label_lower = label_raw.lower()
-            if label_lower in noise_labels:
+            if label_lower in _MATRIX_NOISE_LABELS:
                 continue
 
             values = parts[1:]
@@ -237,98 +312,27 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
             elif len(values) > dimm_count:
                 values = values[:dimm_count]
 
-            # Canonical mapping
-            if label_lower in ("size/capacity", "module capacity", "module size"):
-                canonical_key = "module_gb"
-            elif "module manufacturer" in label_lower:
-                canonical_key = "manufacturer"
-            elif label_lower == "dram manufacturer":
-                canonical_key = "dram_mfg"
-            elif label_lower == "part number":
-                canonical_key = "module_part_number"
-            elif label_lower == "fundamental memory type":
-                canonical_key = "generation"
-            elif label_lower == "module nominal voltage":
-                canonical_key = "JEDEC_voltage"
-            elif label_lower == "minimum voltage":
-                canonical_key = "min_voltage"
-            elif label_lower == "maximum voltage":
-                canonical_key = "max_voltage"
-            elif label_lower == "configured voltage":
-                canonical_key = "configured_voltage"
-            elif label_lower == "configured memory speed" or label_lower == "configured speed":
-                canonical_key = "configured_speed"
-            elif label_lower == "ranks" or "number of ranks" in label_lower:
-                canonical_key = "module_ranks"
-            elif label_lower == "sdram device width":
-                canonical_key = "SDRAM Device Width"
-            elif label_lower == "guessing dimm is in":
-                canonical_key = "Guessing DIMM is in"
-            elif label_lower == "jedec timings":
-                canonical_key = "JEDEC Timings"
-            elif label_lower == "additional jedec timings malformed":
-                canonical_key = "Additional JEDEC Timings malformed"
-            elif label_raw == "Malformed Line With Too Many Columns":
-                canonical_key = "Malformed Line With Too Many Columns"
-            elif label_lower == "pmic manufacturer":
-                canonical_key = "PMIC Manufacturer"
-            elif label_lower == "hynix ic part number":
-                canonical_key = "Hynix IC Part Number"
-            else:
-                canonical_key = label_raw
+            # Canonical mapping: exact labels first, then substring rules.
+            canonical_key = _MATRIX_LABEL_KEYS.get(label_lower)
+            if canonical_key is None:
+                for fragment, key in _MATRIX_LABEL_FRAGMENT_KEYS:
+                    if fragment in label_lower:
+                        canonical_key = key
+                        break
+                else:
+                    canonical_key = label_raw
 
             for i, raw_val in enumerate(values):
                 val = raw_val.strip()
+                dimm = dimms[i]
                 if not val:
+                    # Placeholder keys are present on every DIMM column.
+                    if canonical_key in _MATRIX_PLACEHOLDER_KEYS:
+                        dimm.setdefault(canonical_key, "")
                     continue
-                dimm = dimms[i]
-
-                if canonical_key == "module_gb":
-                    dimm["module_gb"] = val
-                elif canonical_key == "manufacturer":
-                    dimm["manufacturer"] = val
-                elif canonical_key == "dram_mfg":
-                    dimm["dram_mfg"] = val
-                elif canonical_key == "module_part_number":
-                    dimm["module_part_number"] = val
-                elif canonical_key == "generation":
-                    dimm["generation"] = val
-                elif canonical_key == "JEDEC_voltage":
-                    dimm["JEDEC_voltage"] = val
-                elif canonical_key == "min_voltage":
-                    dimm["min_voltage"] = val
-                elif canonical_key == "max_voltage":
-                    dimm["max_voltage"] = val
-                elif canonical_key == "configured_voltage":
-                    dimm["configured_voltage"] = val
-                elif canonical_key == "configured_speed":
-                    dimm["configured_speed"] = val
-                elif canonical_key == "module_ranks":
-                    dimm["module_ranks"] = val
-                elif canonical_key == "SDRAM Device Width":
-                    dimm["SDRAM Device Width"] = val
-                elif canonical_key == "Guessing DIMM is in":
-                    dimm["Guessing DIMM is in"] = val
+                dimm[canonical_key] = val
+                if canonical_key == "Guessing DIMM is in":
                     dimm["slot"] = val
-                elif canonical_key == "JEDEC Timings":
-                    dimm["JEDEC Timings"] = val
-                elif canonical_key == "Additional JEDEC Timings malformed":
-                    dimm["Additional JEDEC Timings malformed"] = val
-                elif canonical_key == "Malformed Line With Too Many Columns":
-                    dimm["Malformed Line With Too Many Columns"] = val
-                elif canonical_key == "PMIC Manufacturer":
-                    dimm["PMIC Manufacturer"] = val
-                elif canonical_key == "Hynix IC Part Number":
-                    dimm["Hynix IC Part Number"] = val
-                else:
-                    dimm[canonical_key] = val
-
-            if label_lower == "additional jedec timings malformed":
-                for d in dimms:
-                    d.setdefault("Additional JEDEC Timings malformed", "")
-            if label_raw == "Malformed Line With Too Many Columns":
-                for d in dimms:
-                    d.setdefault("Malformed Line With Too Many Columns", "")
 
         dimms_matrix = [d for d in dimms if d]
 
@@ -341,34 +345,6 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
     pending_fields: Dict[str, Any] = {}
     saw_header = False
 
-    def _normalize_slot_string(slot_val: str) -> str:
-        return " ".join(str(slot_val).lower().split())
-
-    def _derive_slots_from_guess(raw_val: str) -> List[str]:
-        """
-        Minimal helper for 'Guessing DIMM is in ...' lines.
-
-        Behavior (fixture-aligned):
-        - If value contains both 'bank 3' and 'bank 4' (any spacing), return
-          ['bank 3', 'bank 4'] in that order.
-        - If it contains a single recognizable 'bank N' or 'dimm N', return [that].
-        - Otherwise, return [raw_val] as a best-effort single slot.
-        """
-        normalized = _normalize_slot_string(raw_val)
-        if not normalized:
-            return []
-
-        # Explicit aggregate handling for the spec fixture.
-        if "bank 3" in normalized and "bank 4" in normalized:
-            return ["bank 3", "bank 4"]
-
-        # Single slot best-effort.
-        m = re.search(r"(bank|dimm)\s*\d+", normalized)
-        if m:
-            return [m.group(0)]
-
-        return [raw_val]
-
     def _commit_block() -> None:
         """
         Commit the current plain-text block into dimms_plain.
@@ -423,25 +399,21 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
 
         # Plain-text key/value lines use multi-space separation.
         # Allow 2 or more spaces, tolerant of alignment noise.
-        if "  " not in line:
+        key_part, sep, val_part = line.partition("  ")
+        if not sep:
             continue
 
-        key_part, val_part = line.split("  ", 1)
         key = key_part.strip().rstrip(":")
         val = val_part.strip()
         if not key or not val:
             continue
 
-        kl = key.lower()
-
         # Noise robustness: ignore obviously irrelevant / test-garbage keys.
-        if key in {
-            "Noise",
-            "Debug",
-            "Random garbage line not using pipes at all",
-        }:
+        if key in _PLAIN_NOISE_KEYS:
             continue
 
+        kl = key.lower()
+
         if "fundamental memory type" in kl or "memory type" in kl:
             pending_fields["generation"] = val
         elif "module manufacturer" in kl or "module mfg" in kl:
@@ -452,7 +424,6 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
             pending_fields["Module Capacity"] = val
             # Also add to module_gb for consistency with matrix parsing
             pending_fields["module_gb"] = val
-            pending_fields["module_gb"] = val
         elif kl == "ranks" or kl.startswith("ranks "):
             pending_fields["Ranks"] = val
             pending_fields["module_ranks"] = val
@@ -460,8 +431,6 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
             pending_fields["SDRAM Device Width"] = val
         elif "module nominal voltage" in kl:
             pending_fields["JEDEC_voltage"] = val
-            # Also add to JEDEC_voltage for consistency
-            pending_fields["JEDEC_voltage"] = val
         elif "minimum voltage" in kl:
             pending_fields["min_voltage"] = val
         elif "maximum voltage" in kl:
@@ -480,7 +449,7 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
                 if len(parts) == 2:
                     freq_part, timing_part = parts
                     # Extract just the number from freq_part (e.g., "DDR4-3600" -> "3600")
-                    freq_match = re.search(r'(\d+)$', freq_part)
+                    freq_match = _RE_TRAILING_INT.search(freq_part)
                     if freq_match:
                         freq = freq_match.group(1)
                         # Clean up timing part (remove extra spaces, dashes)
@@ -488,8 +457,7 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
                         pending_fields["timings_xmp"] = f"{freq}-{timing}"
         elif "guessing dimm is in" in kl:
             # Single aggregate-slot handler, evaluated exactly once per block.
-            slots = _derive_slots_from_guess(val)
-            current_block_ids = slots or []
+            current_block_ids = list(_derive_slots_from_guess(val))
             # Store raw; will be normalized per-slot at commit.
             pending_fields["Guessing DIMM is in"] = val
         else:
@@ -499,7 +467,7 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
     # Commit trailing block at EOF.
     _commit_block()
 
-    if True: # Always debug print here if DEBUG is true (handled inside _debug_print)
+    if utils.DEBUG:
         _debug_print(
             f"parse_output: parsed {len(dimms_plain)} DIMM(s) from plain decode-dimms output."
         )
@@ -533,7 +501,7 @@ def parse_output(raw_output: str) -> List[Dict[str, Any]]:
         generation = d.get("generation", "")
         if conf_speed and generation and "timings" not in d:
             # Extract numeric speed (e.g. "3200 MT/s" -> 3200)
-            match = re.search(r"(\d+)", conf_speed)
+            match = _RE_FIRST_INT.search(conf_speed)
             if match:
                 speed_mt = int(match.group(1))
                 d["timings"] = infer_timings(speed_mt, generation)
@@ -545,10 +513,12 @@ def deduplicate_dimms(dimms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Simplified deduplication to ensure one logical record per physical DIMM.
 
     Strategy:
-    - Use (slot, module_part_number, manufacturer) as the unique key
+    - Use (slot, part number, manufacturer, generation), compared
+      case-insensitively, as the unique key; the part number falls back to a
+      raw "Part Number" field
     - Maintain the first occurrence of each unique DIMM
     - Preserve original order
-    - Handle missing fields gracefully
+    - Records with none of the key fields are all kept
 
     This conservative approach handles overlapping representations from plain
     and side-by-side style outputs without complex logic.
@@ -563,19 +533,17 @@ def deduplicate_dimms(dimms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     deduped = []
 
     for dimm in dimms:
-        # Extract key fields with safe defaults
-        slot = str(dimm.get("slot", "")).strip().lower()
-        part_number = str(dimm.get("module_part_number", "")).strip().lower()
-        manufacturer = str(dimm.get("manufacturer", "")).strip().lower()
-
-        # Create unique key - skip if all fields are empty
-        key = (slot, part_number, manufacturer)
-        if not any(key):
-            continue
-
-        # Keep first occurrence only
-        if key not in seen_keys:
+        # parse_output() values are already str, so no coercion is needed.
+        key = (
+            dimm.get("slot", "").strip().lower(),
+            dimm.get("module_part_number", dimm.get("Part Number", "")).strip().lower(),
+            dimm.get("manufacturer", "").strip().lower(),
+            dimm.get("generation", "").strip().lower(),
+        )
+        if any(key):
+            if key in seen_keys:
+                continue
             seen_keys.add(key)
-            deduped.append(dimm)
+        deduped.append(dimm)
 
-    return deduped
\ No newline at end of file
+    return deduped
@@ -1,21 +1,147 @@
+import errno
+import fcntl
 import shutil
 import subprocess
 import os
 import sys
 import re
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 import RamSleuth_DB
-from .utils import _debug_print, load_die_database, DEBUG
-from .parser import parse_output, extract_profiles_from_spd
+from . import utils
+from .utils import _debug_print, load_die_database
+from .parser import parse_output, extract_profiles_from_spd, deduplicate_dimms
 from .dependency_engine import check_dependency, install_dependency
 
 class SmbusNotFoundError(Exception):
     """Raised when no SMBus/I2C busses are detected."""
     pass
 
+# find_smbus() adapter filters: GPU-related adapters are excluded, the rest
+# must look like a chipset SMBus controller.
+# i2cdetect output is plain ASCII, so it is parsed as bytes without decoding.
+_RE_SMBUS_EXCLUDE = re.compile(rb"nvidia|gpu|graphics", re.IGNORECASE)
+_RE_SMBUS_INCLUDE = re.compile(rb"smbus|piix4|amd|intel", re.IGNORECASE)
+_RE_I2C_ADAPTER = re.compile(rb"i2c-(\d+)")
+
+# Patterns used by get_current_memory_settings(), compiled once at import.
+_RE_FIRST_INT = re.compile(r'(\d+)')
+# G.Skill/Corsair style "3600C18" / "6000J30" (speed + CAS latency)
+_RE_PN_SPEED_CL = re.compile(r'(\d{4})[CJ](\d+)')
+# Kingston/HyperX shortened "KF432C16" (32 -> 3200)
+_RE_PN_KINGSTON = re.compile(r'(?:KF|HX)4(\d{2})C(\d+)')
+
+# i2cdetect -y table cells that denote an SPD EEPROM address (0x50-0x57),
+# mapped to their value. Some builds print three hex digits.
+_SPD_ADDR_TOKENS: Dict[bytes, int] = {
+    f"{addr:0{width}x}".encode("ascii"): addr
+    for addr in range(0x50, 0x58)
+    for width in (2, 3)
+}
+
+# `i2cdetect -l` only lists adapters from sysfs; a short bound keeps startup
+# from stalling when the kernel i2c core is wedged.
+_LIST_ADAPTERS_TIMEOUT = 2
+
+def _scan_bus_timeout() -> int:
+    """Return the `i2cdetect -y` timeout in seconds (RAMSLEUTH_SCAN_TIMEOUT, default 30)."""
+    try:
+        return max(1, int(os.environ.get("RAMSLEUTH_SCAN_TIMEOUT", "30")))
+    except ValueError:
+        return 30
+
+# Per-bus scans may clock-stretch for a long time on empty software busses.
+SCAN_BUS_TIMEOUT = _scan_bus_timeout()
+
+# Resolved executable paths, so per-bus scans don't repeat the PATH walk.
+# Only hits are cached: a tool installed mid-run is still picked up.
+_TOOL_PATHS: Dict[str, str] = {}
+
+def _debug_stderr() -> int:
+    """
+    stderr target for helper commands: captured only when debug logging is on,
+    since it is otherwise never read.
+    """
+    return subprocess.PIPE if utils.DEBUG else subprocess.DEVNULL
+
+def _tool_path(name: str) -> Optional[str]:
+    """Return the full path of executable `name` (cached), or None."""
+    path = _TOOL_PATHS.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _TOOL_PATHS[name] = path
+    return path
+
+_I2C_DEV_SYSFS = "/sys/class/i2c-dev"
+
+# linux/i2c-dev.h and linux/i2c.h: the I2C_FUNCS ioctl and the functionality
+# bits i2cdetect uses to label an adapter "smbus" in its type column.
+_I2C_FUNCS = 0x0705
+_I2C_FUNC_I2C = 0x00000001
+_I2C_FUNC_SMBUS_BASIC = 0x007E0000  # SMBUS_BYTE | SMBUS_BYTE_DATA | SMBUS_WORD_DATA
+
+def _is_smbus_adapter(bus_id: int) -> bool:
+    """
+    Return True if i2cdetect would report /dev/i2c-<bus_id> as type "smbus".
+
+    That is the case for adapters offering byte/word SMBus transfers but not
+    plain I2C. An adapter that cannot be opened or queried is "unknown" to
+    i2cdetect, so it is reported as False here too.
+    """
+    try:
+        fd = os.open(f"/dev/i2c-{bus_id}", os.O_RDWR)
+    except OSError:
+        return False
+    try:
+        funcs = bytearray(8)
+        fcntl.ioctl(fd, _I2C_FUNCS, funcs)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+    value = int.from_bytes(funcs, sys.byteorder)
+    return not value & _I2C_FUNC_I2C and bool(value & _I2C_FUNC_SMBUS_BASIC)
+
+def _find_smbus_sysfs() -> List[int]:
+    """
+    Discover SMBus adapters from /sys/class/i2c-dev/i2c-N/name.
+
+    Applies the same include/exclude filters as find_smbus() to the adapter
+    name, without spawning `i2cdetect -l`. As with the type column of that
+    listing, an adapter whose name lacks an include token still qualifies
+    when it is SMBus-only (see _is_smbus_adapter()).
+
+    Returns:
+        Sorted list of unique bus IDs; [] if sysfs is unavailable or nothing matched.
+    """
+    try:
+        entries = os.listdir(_I2C_DEV_SYSFS)
+    except OSError:
+        return []
+
+    candidates = set()
+    for entry in entries:
+        adapter = _RE_I2C_ADAPTER.fullmatch(entry.encode())
+        if not adapter:
+            continue
+        try:
+            with open(os.path.join(_I2C_DEV_SYSFS, entry, "name"), "rb") as f:
+                name = f.read().strip()
+        except OSError:
+            continue
+        if _RE_SMBUS_EXCLUDE.search(name):
+            continue
+        bus_id = int(adapter.group(1))
+        if not _RE_SMBUS_INCLUDE.search(name) and not _is_smbus_adapter(bus_id):
+            continue
+        candidates.add(bus_id)
+
+    return sorted(candidates)
+
 def find_smbus() -> List[int]:
     """
-    Discover SMBus/I2C adapters via `i2cdetect -l`.
+    Discover SMBus/I2C adapters via sysfs, falling back to `i2cdetect -l`.
 
     Heuristics:
     - Lines containing any of:
@@ -26,21 +152,27 @@ def find_smbus() -> List[int]:
       are excluded as GPU-related.
     - Extract adapter ID from first token "i2c-N" -> N.
 
+    The adapter names under /sys/class/i2c-dev are checked first; the
+    `i2cdetect -l` subprocess only runs when that yields no candidates.
+
     Returns:
         Sorted list of unique bus IDs. On failure, returns [].
     """
-    which = shutil.which("i2cdetect")
+    which = _tool_path("i2cdetect")
     if which is None:
         return []
 
+    sysfs_busses = _find_smbus_sysfs()
+    if sysfs_busses:
+        return sysfs_busses
+
     try:
         proc = subprocess.run(
             [which, "-l"],
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            timeout=30
+            timeout=_LIST_ADAPTERS_TIMEOUT
         )
     except FileNotFoundError:
         _debug_print(f"find_smbus: i2cdetect not found at {which}")
@@ -50,34 +182,26 @@ def find_smbus() -> List[int]:
         return []
 
     if proc.returncode != 0:
-        stderr_text = proc.stderr or ""
+        stderr_text = (proc.stderr or b"").decode(errors="replace")
         _debug_print(
             f"find_smbus: i2cdetect -l failed with returncode {proc.returncode}"
             f"{': ' + stderr_text.strip() if stderr_text else ''}"
         )
         return []
 
-    candidates: List[int] = []
+    candidates = set()
     for line in proc.stdout.splitlines():
         line = line.strip()
         if not line:
             continue
-        lower = line.lower()
-        if any(tag.lower() in lower for tag in ["nvidia", "gpu", "graphics"]):
+        if _RE_SMBUS_EXCLUDE.search(line):
             continue
-        if not any(
-            tag.lower() in lower
-            for tag in ["smbus", "piix4", "amd", "intel"]
-        ):
+        if not _RE_SMBUS_INCLUDE.search(line):
             continue
         # First token typically "i2c-N"
-        first = line.split()[0]
-        if first.startswith("i2c-"):
-            num_str = first[4:]
-            if num_str.isdigit():
-                bus_id = int(num_str)
-                if bus_id not in candidates:
-                    candidates.append(bus_id)
+        adapter = _RE_I2C_ADAPTER.fullmatch(line.split()[0])
+        if adapter:
+            candidates.add(int(adapter.group(1)))
 
     return sorted(candidates)
 
@@ -91,7 +215,7 @@ def scan_bus(bus_id: int) -> List[int]:
         Sorted unique list of integer addresses.
         If the command fails or no addresses found, returns [].
     """
-    which = shutil.which("i2cdetect")
+    which = _tool_path("i2cdetect")
     if which is None:
         return []
 
@@ -101,8 +225,7 @@ def scan_bus(bus_id: int) -> List[int]:
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            timeout=30
+            timeout=SCAN_BUS_TIMEOUT
         )
     except FileNotFoundError:
         _debug_print(f"scan_bus: i2cdetect not found at {which}")
@@ -112,39 +235,117 @@ def scan_bus(bus_id: int) -> List[int]:
         return []
 
     if proc.returncode != 0:
-        stderr_text = proc.stderr or ""
+        stderr_text = (proc.stderr or b"").decode(errors="replace")
         _debug_print(
             f"scan_bus: i2cdetect -y {bus_id} failed with returncode {proc.returncode}"
             f"{': ' + stderr_text.strip() if stderr_text else ''}"
         )
         return []
 
-    addrs: List[int] = []
-    for line in proc.stdout.splitlines():
-        # Typical i2cdetect table rows; tokens may be:
-        # "50", "51", or "--" etc.
-        parts = line.strip().split()
-        for token in parts:
-            # Skip header labels like "0:", "10:", etc.
-            if token.endswith(":"):
-                continue
-            # Only consider hex-like tokens
-            if all(c in "0123456789abcdefABCDEF" for c in token) and len(
-                token
-            ) in (2, 3):
-                try:
-                    val = int(token, 16)
-                except ValueError:
-                    continue
-                if 0x50 <= val <= 0x57:
-                    if val not in addrs:
-                        addrs.append(val)
+    # Table cells are "--", "UU" or a hex address; row labels ("50:") and
+    # the column header never collide with an SPD address token.
+    addrs = {
+        _SPD_ADDR_TOKENS[token]
+        for token in proc.stdout.split()
+        if token in _SPD_ADDR_TOKENS
+    }
     return sorted(addrs)
 
-def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str, Any]] = None) -> Dict[str, str]:
+def scan_all_busses(bus_ids: List[int]) -> Dict[int, List[int]]:
+    """
+    Run scan_bus() for every bus concurrently.
+
+    Each scan is an independent, subprocess-bound `i2cdetect -y` call, so the
+    per-bus latencies overlap instead of adding up.
+
+    Returns:
+        Mapping of bus ID -> detected SPD addresses, in bus_ids order.
+    """
+    if not bus_ids:
+        return {}
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(bus_ids))) as executor:
+        return dict(zip(bus_ids, executor.map(scan_bus, bus_ids)))
+
+def _is_populated_memory_device(device: Dict[str, str]) -> bool:
+    size = device.get("Size", "")
+    return bool(size) and "No Module" not in size and "Not Installed" not in size
+
+def _first_populated_memory_device(dmidecode_output: str) -> Optional[Dict[str, str]]:
+    """
+    Return the fields of the first populated "Memory Device" block in
+    `dmidecode -t memory` output, or None.
+
+    A block ends at a blank line or at the end of the output; scanning stops
+    at the first populated one, and an empty slot's remaining lines are
+    skipped as soon as its Size line is seen.
+    """
+    device: Optional[Dict[str, str]] = None
+    for line in dmidecode_output.splitlines():
+        line = line.strip()
+        if line.startswith("Memory Device"):
+            device = {}
+            continue
+        if device is None:
+            continue
+        if not line:
+            # End of device
+            if _is_populated_memory_device(device):
+                return device
+            device = None
+            continue
+        if ":" in line:
+            k, v = line.split(":", 1)
+            k = k.strip()
+            v = v.strip()
+            if k == "Size" and ("No Module" in v or "Not Installed" in v):
+                # Empty slot: skip the rest of this block
+                device = None
+                continue
+            device[k] = v
+
+    # Output may end inside the last device block
+    if device is not None and _is_populated_memory_device(device):
+        return device
+    return None
+
+# Successful `dmidecode -t memory` output for this process; the DMI tables
+# do not change while we run, so settings refreshes reuse it.
+_dmidecode_memory_output: Optional[str] = None
+
+def _read_dmidecode_memory(dmidecode: str, refresh: bool = False) -> Optional[str]:
+    """
+    Return `dmidecode -t memory` output, running it only on first use (or when
+    refresh is True). Returns None if dmidecode exits non-zero.
+    """
+    global _dmidecode_memory_output
+    if _dmidecode_memory_output is None or refresh:
+        result = subprocess.run(
+            [dmidecode, "-t", "memory"], capture_output=True, text=True, check=False, timeout=10
+        )
+        if result.returncode != 0:
+            return None
+        _dmidecode_memory_output = result.stdout
+    return _dmidecode_memory_output
+
+@lru_cache(maxsize=1)
+def _spd_profiles(spd_output: str) -> Dict[str, Dict[str, str]]:
+    """
+    extract_profiles_from_spd() for the most recent SPD dump. Settings
+    refreshes pass the same dimm_0 block each time, so it is scanned once.
+    Callers must treat the result as read-only.
+    """
+    return extract_profiles_from_spd(spd_output)
+
+def get_current_memory_settings(
+    spd_output: str = "", dimms_data: List[Dict[str, Any]] = None, refresh: bool = False
+) -> Dict[str, str]:
     """
     Parses `dmidecode -t memory` to find current operating speed and voltage.
     Matches this against SPD data to infer the active profile.
+
+    dmidecode runs once per process; pass refresh=True to re-read it.
     """
     settings = {
         "Configured Speed": "N/A",
@@ -154,14 +355,13 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
     }
     
     # Check if dmidecode is available
-    if not shutil.which("dmidecode"):
+    dmidecode = _tool_path("dmidecode")
+    if not dmidecode:
         return settings
     
-    cmd = ["dmidecode", "-t", "memory"]
-    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=10)
-        if result.returncode != 0:
+        dmidecode_output = _read_dmidecode_memory(dmidecode, refresh=refresh)
+        if dmidecode_output is None:
             return settings
             
         # Parse dmidecode output for the first populated slot
@@ -169,45 +369,13 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
         current_voltage = None
         part_number = "Unknown"
         
-        current_device = {}
-        in_device = False
-        
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if line.startswith("Memory Device"):
-                in_device = True
-                current_device = {}
-                continue
-            if not line and in_device:
-                # End of device
-                size = current_device.get("Size", "")
-                if size and "No Module" not in size and "Not Installed" not in size:
-                    # Found populated device
-                    current_speed = current_device.get("Configured Memory Speed", current_device.get("Speed"))
-                    current_voltage = current_device.get("Configured Voltage")
-                    part_number = current_device.get("Part Number")
-                    settings["Part Number"] = part_number
-                    settings["Manufacturer"] = current_device.get("Manufacturer", "Unknown")
-                    break # Use first found
-                in_device = False
-                continue
-                
-            if in_device and ":" in line:
-                k, v = line.split(":", 1)
-                current_device[k.strip()] = v.strip()
-        
-        # Handle last device if loop finished inside a device block
-        if in_device:
-            size = current_device.get("Size", "")
-            if size and "No Module" not in size and "Not Installed" not in size:
-                 # Found populated device (last one)
-                 # Only update if we haven't found one already (though the break above handles early exit)
-                 if not current_speed:
-                     current_speed = current_device.get("Configured Memory Speed", current_device.get("Speed"))
-                     current_voltage = current_device.get("Configured Voltage")
-                     part_number = current_device.get("Part Number")
-                     settings["Part Number"] = part_number
-                     settings["Manufacturer"] = current_device.get("Manufacturer", "Unknown")
+        device = _first_populated_memory_device(dmidecode_output)
+        if device is not None:
+            current_speed = device.get("Configured Memory Speed", device.get("Speed"))
+            current_voltage = device.get("Configured Voltage")
+            part_number = device.get("Part Number")
+            settings["Part Number"] = part_number
+            settings["Manufacturer"] = device.get("Manufacturer", "Unknown")
 
         if current_speed:
             settings["Configured Speed"] = current_speed
@@ -217,7 +385,7 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
         # Inference Logic
         if current_speed:
             # Clean current speed (remove "MT/s" etc)
-            speed_val_match = re.search(r'(\d+)', current_speed)
+            speed_val_match = _RE_FIRST_INT.search(current_speed)
             if speed_val_match:
                 speed_val = int(speed_val_match.group(1))
                 
@@ -228,20 +396,25 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
                 # We need extracted profiles.
                 profiles = {}
                 if spd_output:
-                     profiles = extract_profiles_from_spd(spd_output)
+                     profiles = _spd_profiles(spd_output)
                 
+                # Parse each profile's speed once; used for both the max
+                # search and the matching below.
+                profile_speeds = []
+                for speed_key, profile_data in profiles.items():
+                    # speed_key is like "3600 MT/s"
+                    p_speed_match = _RE_FIRST_INT.search(speed_key)
+                    if p_speed_match:
+                        profile_speeds.append((int(p_speed_match.group(1)), profile_data))
+
                 # Find the "Max" XMP/EXPO profile regardless of current speed
                 max_xmp_speed = 0
                 max_xmp_profile = None
                 
-                for speed_key, profile_data in profiles.items():
-                    # speed_key is like "3600 MT/s"
-                    p_speed_match = re.search(r'(\d+)', speed_key)
-                    if p_speed_match:
-                        p_speed_val = int(p_speed_match.group(1))
-                        if p_speed_val > max_xmp_speed:
-                            max_xmp_speed = p_speed_val
-                            max_xmp_profile = profile_data
+                for p_speed_val, profile_data in profile_speeds:
+                    if p_speed_val > max_xmp_speed:
+                        max_xmp_speed = p_speed_val
+                        max_xmp_profile = profile_data
 
                 # Fallback: Check dimms_data if spd_output yielded nothing
                 if not max_xmp_profile and dimms_data and len(dimms_data) > 0:
@@ -249,9 +422,13 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
                     xmp_str = first_dimm.get("timings_xmp", "")
                     if xmp_str:
                         # Format like "3600-18-22-22"
-                        xmp_speed_match = re.search(r'^(\d+)', xmp_str)
-                        if xmp_speed_match:
-                            max_xmp_speed = int(xmp_speed_match.group(1))
+                        # Leading digit run is the speed; a plain scan is
+                        # enough, no regex needed.
+                        digits_end = 0
+                        while digits_end < len(xmp_str) and xmp_str[digits_end].isdecimal():
+                            digits_end += 1
+                        if digits_end:
+                            max_xmp_speed = int(xmp_str[:digits_end])
                             
                             # Parse timings from the string "3600-18-22-22" -> "18-22-22"
                             timings_part = "Unknown"
@@ -278,14 +455,14 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
                      # Regex for G.Skill (F4-3600C18...), Corsair (CM...3600C18), etc.
                      # Looks for 4 digits (speed) followed immediately by C and digits (latency)
                      # Matches: 3600C18, 3200C16, 6000J30 (G.Skill DDR5 uses J sometimes)
-                     match = re.search(r'(\d{4})[CJ](\d+)', p_upper)
+                     match = _RE_PN_SPEED_CL.search(p_upper)
                      if match:
                          inferred_speed = int(match.group(1))
                          inferred_cl = match.group(2)
                      else:
                          # Kingston/HyperX Shortened: KF432C16 (32=3200)
                          # Look for specific prefixes to be safe
-                         k_match = re.search(r'(?:KF|HX)4(\d{2})C(\d+)', p_upper)
+                         k_match = _RE_PN_KINGSTON.search(p_upper)
                          if k_match:
                              inferred_speed = int(k_match.group(1)) * 100
                              inferred_cl = k_match.group(2)
@@ -322,13 +499,10 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
                         matched_profile = max_xmp_profile
                     else:
                         # Check other profiles
-                        for speed_key, profile_data in profiles.items():
-                             p_speed_match = re.search(r'(\d+)', speed_key)
-                             if p_speed_match:
-                                 p_speed_val = int(p_speed_match.group(1))
-                                 if abs(speed_val - p_speed_val) < 100:
-                                     matched_profile = profile_data
-                                     break
+                        for p_speed_val, profile_data in profile_speeds:
+                             if abs(speed_val - p_speed_val) < 100:
+                                 matched_profile = profile_data
+                                 break
                 
                 if matched_profile:
                     settings["Active Profile"] = "XMP/EXPO (Active)"
@@ -349,6 +523,73 @@ def get_current_memory_settings(spd_output: str = "", dimms_data: List[Dict[str,
         
     return settings
 
+# Enough of /proc/cpuinfo to cover the first CPU record's vendor_id line.
+_CPUINFO_HEAD_BYTES = 4096
+
+@lru_cache(maxsize=1)
+def _detect_cpu_vendor() -> Optional[str]:
+    """
+    Return "amd", "intel" or None for the running CPU (cached per process).
+
+    Reads the head of /proc/cpuinfo, falling back to `lscpu`.
+    """
+    cpu_vendor = None
+
+    # Preferred: /proc/cpuinfo. vendor_id sits at the top of the first CPU
+    # record, so the rest of the (per-core) file is not read. The kernel
+    # regenerates this file on every read(); a single bounded os.read()
+    # avoids stitching together several buffered reads.
+    try:
+        fd = os.open("/proc/cpuinfo", os.O_RDONLY)
+        try:
+            head = os.read(fd, _CPUINFO_HEAD_BYTES)
+        finally:
+            os.close(fd)
+        # Canonical CPUID vendor strings; unlike a substring test on the
+        # model name, these cannot be confused by e.g. "AMD" in a guest name.
+        if b"AuthenticAMD" in head:
+            cpu_vendor = "amd"
+        elif b"GenuineIntel" in head:
+            cpu_vendor = "intel"
+    except Exception:  # pragma: no cover - defensive
+        cpu_vendor = None
+
+    if cpu_vendor is not None:
+        return cpu_vendor
+
+    # Fallback: lscpu
+    lscpu = _tool_path("lscpu")
+    if lscpu is None:
+        _debug_print("lscpu command not found; cannot detect CPU vendor")
+        return None
+
+    try:
+        proc = subprocess.run(
+            [lscpu],
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=_debug_stderr(),
+            timeout=30
+        )
+        if proc.returncode == 0 and proc.stdout:
+            lower = proc.stdout.lower()
+            if b"amd" in lower:
+                cpu_vendor = "amd"
+            elif b"intel" in lower:
+                cpu_vendor = "intel"
+        else:
+            stderr_text = (proc.stderr or b"").decode(errors="replace")
+            _debug_print(
+                f"lscpu failed with returncode {proc.returncode}"
+                f"{': ' + stderr_text.strip() if stderr_text else ''}"
+            )
+    except FileNotFoundError:
+        _debug_print("lscpu command not found; cannot detect CPU vendor")
+    except Exception as e:  # pragma: no cover - defensive
+        _debug_print(f"lscpu failed with unexpected error: {e}")
+
+    return cpu_vendor
+
 def load_modules() -> None:
     """
     Best-effort, idempotent kernel module loading helper.
@@ -361,6 +602,7 @@ def load_modules() -> None:
     - Detect CPU vendor and try to modprobe:
         * i2c-amd-mp2-pci (for AMD)
         * i2c-i801 (for Intel)
+    - All modules are requested in a single `modprobe -a` invocation.
 
     Behavioral rules:
     - No interactivity; no prompts.
@@ -369,87 +611,43 @@ def load_modules() -> None:
     - Safe to call multiple times:
         * modprobe is idempotent for loaded modules.
     """
-    def _try_modprobe(module: str) -> None:
-        try:
-            # modprobe is generally idempotent; ignore non-zero exits here.
-            subprocess.run(
-                ["modprobe", module],
-                check=False,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=30
-            )
-            _debug_print(f"Attempted to load module '{module}'.")
-        except FileNotFoundError:
-            _debug_print(f"modprobe command not found; cannot load module '{module}'")
-        except Exception as exc:  # pragma: no cover - defensive
-            _debug_print(f"modprobe '{module}' failed: {exc}")
+    # Determine CPU vendor to load the appropriate SMBus controller driver.
+    cpu_vendor = _detect_cpu_vendor()
 
     # Core modules useful for SPD/EEPROM access
     # 'eeprom' is for legacy/DDR3, 'ee1004' for DDR4/5, 'at24' generic
-    for base_mod in ("i2c-dev", "eeprom", "ee1004", "at24"):
-        _try_modprobe(base_mod)
-
-    # Try to determine CPU vendor to load the appropriate SMBus controller driver.
-    cpu_vendor = None
-
-    # Preferred: /proc/cpuinfo
-    try:
-        if os.path.exists("/proc/cpuinfo"):
-            with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
-                for line in f:
-                    lower = line.lower()
-                    if "vendor_id" in lower or "model name" in lower:
-                        if "amd" in lower:
-                            cpu_vendor = "amd"
-                            break
-                        if "intel" in lower:
-                            cpu_vendor = "intel"
-                            break
-    except Exception:  # pragma: no cover - defensive
-        cpu_vendor = None
-
-    # Fallback: lscpu
-    if cpu_vendor is None:
-        try:
-            proc = subprocess.run(
-                ["lscpu"],
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30
-            )
-            if proc.returncode == 0 and proc.stdout:
-                lower = proc.stdout.lower()
-                if "amd" in lower:
-                    cpu_vendor = "amd"
-                elif "intel" in lower:
-                    cpu_vendor = "intel"
-            else:
-                stderr_text = proc.stderr or ""
-                _debug_print(
-                    f"lscpu failed with returncode {proc.returncode}"
-                    f"{': ' + stderr_text.strip() if stderr_text else ''}"
-                )
-        except FileNotFoundError:
-            _debug_print("lscpu command not found; cannot detect CPU vendor")
-        except Exception as e:  # pragma: no cover - defensive
-            _debug_print(f"lscpu failed with unexpected error: {e}")
+    modules = ["i2c-dev", "eeprom", "ee1004", "at24"]
 
     if cpu_vendor == "amd":
-        # Try AMD SMBus drivers in order of preference
-        amd_modules = ["i2c-amd-mp2-pci", "i2c-amd-mp2"]
-        for module in amd_modules:
-            _try_modprobe(module)
+        # AMD SMBus drivers in order of preference
+        modules += ["i2c-amd-mp2-pci", "i2c-amd-mp2"]
     elif cpu_vendor == "intel":
-        # Try Intel SMBus drivers in order of preference
-        intel_modules = ["i2c-i801", "i2c-piix4"]
-        for module in intel_modules:
-            _try_modprobe(module)
+        # Intel SMBus drivers in order of preference
+        modules += ["i2c-i801", "i2c-piix4"]
     else:
         _debug_print("CPU vendor unknown; skipping vendor-specific i2c module probes.")
 
+    modprobe = _tool_path("modprobe")
+    if modprobe is None:
+        _debug_print(f"modprobe command not found; cannot load modules {modules}")
+        return
+
+    try:
+        # One invocation for all modules: `-a` keeps going past modules that
+        # fail to load, and modprobe is idempotent for loaded ones.
+        proc = subprocess.run(
+            [modprobe, "-a", *modules],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30
+        )
+        _debug_print(f"Attempted to load modules {modules} (modprobe returncode {proc.returncode}).")
+    except FileNotFoundError:
+        _debug_print(f"modprobe command not found; cannot load modules {modules}")
+    except Exception as exc:  # pragma: no cover - defensive
+        _debug_print(f"modprobe {modules} failed: {exc}")
+
 def register_devices(bus_id: int, addresses: List[int]) -> None:
     """
     Best-effort sysfs registration of detected SPD EEPROM devices.
@@ -488,19 +686,19 @@ def register_devices(bus_id: int, addresses: List[int]) -> None:
             with open(new_device_path, 'w', encoding='utf-8') as f:
                 f.write(echo_cmd)
                 
-            _debug_print(f"register_devices: successfully wrote '{echo_cmd}' to {new_device_path}")
-            
+            _debug_print(lambda: f"register_devices: successfully wrote '{echo_cmd}' to {new_device_path}")
+
         except OSError as e:
             # EEXIST (File exists) is common and harmless (device already registered)
             # EBUSY (Device or resource busy) is also possible
-            if e.errno == 17:  # EEXIST
-                _debug_print(f"register_devices: device 0x{addr:02x} already registered on bus {bus_id} (File exists)")
-            elif e.errno == 16:  # EBUSY
-                _debug_print(f"register_devices: device 0x{addr:02x} or bus {bus_id} is busy (EBUSY)")
-            elif e.errno == 22:  # EINVAL
-                _debug_print(f"register_devices: invalid argument for 0x{addr:02x} on bus {bus_id} (EINVAL)")
+            if e.errno == errno.EEXIST:
+                _debug_print(lambda: f"register_devices: device 0x{addr:02x} already registered on bus {bus_id} (File exists)")
+            elif e.errno == errno.EBUSY:
+                _debug_print(lambda: f"register_devices: device 0x{addr:02x} or bus {bus_id} is busy (EBUSY)")
+            elif e.errno == errno.EINVAL:
+                _debug_print(lambda: f"register_devices: invalid argument for 0x{addr:02x} on bus {bus_id} (EINVAL)")
             else:
-                _debug_print(f"register_devices: OS error registering 0x{addr:02x} on bus {bus_id}: {e}")
+                _debug_print(lambda: f"register_devices: OS error registering 0x{addr:02x} on bus {bus_id}: {e}")
         except Exception as exc:  # pragma: no cover - defensive
             _debug_print(
                 f"register_devices: unexpected exception while registering 0x{addr:02x} "
@@ -517,7 +715,33 @@ def _split_decode_dimms_blocks_wrapper(output: str) -> Dict[str, str]:
     from .parser import _split_decode_dimms_blocks
     return _split_decode_dimms_blocks(output)
 
-def run_decoder() -> Tuple[str, Dict[str, str]]:
+# Completed decode-dimms runs keyed by argv. Reading every SPD EEPROM over
+# SMBus is slow and the contents do not change while we run; rescans pass
+# refresh=True to read the hardware again.
+_decode_dimms_runs: Dict[Tuple[str, ...], "subprocess.CompletedProcess[str]"] = {}
+
+def _run_decode_dimms(argv: Tuple[str, ...], refresh: bool = False) -> "subprocess.CompletedProcess[str]":
+    """
+    Return the completed `decode-dimms` process for argv, running it only on
+    first use (or when refresh is True). Exceptions (e.g. timeouts) are
+    propagated and not cached.
+    """
+    proc = _decode_dimms_runs.get(argv)
+    if proc is None or refresh:
+        proc = subprocess.run(
+            list(argv),
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=_debug_stderr(),
+            timeout=30
+        )
+        # Decode each stream once rather than through a text-mode wrapper.
+        proc.stdout = proc.stdout.decode("utf-8", errors="replace")
+        proc.stderr = (proc.stderr or b"").decode("utf-8", errors="replace")
+        _decode_dimms_runs[argv] = proc
+    return proc
+
+def run_decoder(refresh: bool = False, raw_blocks: bool = True) -> Tuple[str, Dict[str, str]]:
     """
     Invoke `decode-dimms` to obtain SPD/EEPROM information.
 
@@ -535,35 +759,29 @@ def run_decoder() -> Tuple[str, Dict[str, str]]:
       * Otherwise:
         - combined_output -> parse_output()
         - raw_individual_blocks -> _split_decode_dimms_blocks() from plain when available,
-          empty dict when using side-by-side fallback.
+          empty dict when using side-by-side fallback or when raw_blocks is False
+          (callers that never display raw SPD blocks skip the split).
+
+    Output is cached per process (see _run_decode_dimms); refresh=True
+    re-runs decode-dimms.
 
     Returns:
         (combined_output_for_parser, raw_individual_blocks)
     """
-    decoder = shutil.which("decode-dimms")
+    decoder = _tool_path("decode-dimms")
     if decoder is None:
         raise RuntimeError("Required tool 'decode-dimms' not found")
 
     # Try plain decode-dimms first (primary source - works on 95%+ of systems)
     try:
-        try:
-            plain_proc = subprocess.run(
-                [decoder],
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30
-            )
-        except subprocess.TimeoutExpired:
-            _debug_print(f"run_decoder: decode-dimms timed out after 30 seconds")
-            raise RuntimeError("decode-dimms execution timed out")
-        except Exception as exc:
-            _debug_print(f"run_decoder: decode-dimms execution failed: {exc}")
-            raise RuntimeError(f"decode-dimms execution failed: {exc}") from exc
+        plain_proc = _run_decode_dimms((decoder,), refresh)
+    except subprocess.TimeoutExpired:
+        _debug_print("run_decoder: decode-dimms timed out after 30 seconds")
+        raise RuntimeError("decode-dimms execution timed out")
     except FileNotFoundError:
         raise RuntimeError("Required tool 'decode-dimms' not found")
-    except Exception as exc:  # pragma: no cover - defensive
+    except Exception as exc:
+        _debug_print(f"run_decoder: decode-dimms execution failed: {exc}")
         raise RuntimeError(f"decode-dimms execution failed: {exc}") from exc
 
     plain_ok = plain_proc.returncode == 0 and (plain_proc.stdout or "").strip() != ""
@@ -572,10 +790,13 @@ def run_decoder() -> Tuple[str, Dict[str, str]]:
         # Primary case: plain decode-dimms succeeded
         # Use plain output for both combined and raw_individual blocks
         combined = plain_proc.stdout
-        from .parser import _split_decode_dimms_blocks
-        raw_individual = _split_decode_dimms_blocks(plain_proc.stdout)
-        
-        if DEBUG:
+        if raw_blocks:
+            from .parser import _split_decode_dimms_blocks
+            raw_individual = _split_decode_dimms_blocks(plain_proc.stdout)
+        else:
+            raw_individual = {}
+
+        if utils.DEBUG:
             _debug_print(
                 f"run_decoder: plain decode-dimms succeeded, "
                 f"combined_len={len(combined)}, blocks={len(raw_individual)}"
@@ -583,24 +804,14 @@ def run_decoder() -> Tuple[str, Dict[str, str]]:
     else:
         # Fallback: try side-by-side if plain failed
         try:
-            try:
-                side_proc = subprocess.run(
-                    [decoder, "--side-by-side"],
-                    check=False,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=30
-                )
-            except subprocess.TimeoutExpired:
-                _debug_print(f"run_decoder: decode-dimms --side-by-side timed out after 30 seconds")
-                side_proc = None
-            except Exception as exc:
-                _debug_print(f"run_decoder: decode-dimms --side-by-side failed: {exc}")
-                side_proc = None
-        except Exception as exc:  # pragma: no cover - defensive
-            side_proc = None  # Mark as failed
-        
+            side_proc = _run_decode_dimms((decoder, "--side-by-side"), refresh)
+        except subprocess.TimeoutExpired:
+            _debug_print("run_decoder: decode-dimms --side-by-side timed out after 30 seconds")
+            side_proc = None
+        except Exception as exc:
+            _debug_print(f"run_decoder: decode-dimms --side-by-side failed: {exc}")
+            side_proc = None
+
         side_ok = side_proc and side_proc.returncode == 0 and (side_proc.stdout or "").strip() != ""
         
         if not side_ok:
@@ -608,7 +819,7 @@ def run_decoder() -> Tuple[str, Dict[str, str]]:
             plain_stderr = plain_proc.stderr or ""
             side_stderr = side_proc.stderr if side_proc else ""
             
-            if DEBUG:
+            if utils.DEBUG:
                 _debug_print(
                     f"run_decoder: both decode-dimms invocations failed - "
                     f"plain returncode={plain_proc.returncode}"
@@ -623,7 +834,7 @@ def run_decoder() -> Tuple[str, Dict[str, str]]:
         combined = side_proc.stdout
         raw_individual = {}  # No individual blocks from side-by-side
         
-        if DEBUG:
+        if utils.DEBUG:
             _debug_print(
                 f"run_decoder: plain failed, side-by-side succeeded as fallback, "
                 f"combined_len={len(combined)}"
@@ -631,16 +842,28 @@ def run_decoder() -> Tuple[str, Dict[str, str]]:
 
     return combined, raw_individual
 
-def perform_system_scan(test_data_mode: bool = False, fail_on_no_smbus: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+def perform_system_scan(
+    test_data_mode: bool = False,
+    fail_on_no_smbus: bool = False,
+    refresh: bool = False,
+    raw_blocks: bool = True,
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
     """
     Execute the full system scan, parsing, and identification workflow.
 
     Args:
         test_data_mode: If True, load from test_data.txt instead of hardware scan.
         fail_on_no_smbus: If True, raise SmbusNotFoundError if no busses found.
+        refresh: If True, re-run decode-dimms instead of reusing this process's
+            earlier output.
+        raw_blocks: If False, skip splitting per-DIMM raw SPD blocks (the
+            second tuple element is then empty); for output modes that never
+            show them.
 
     Returns:
-        Tuple of (dimms_list, raw_individual_blocks_dict)
+        Tuple of (dimms_list, raw_individual_blocks_dict). Every DIMM is
+        already normalized and carries its resolved "die_type" (and "notes"
+        when any), so output modes need no further processing.
     
     Raises:
         SmbusNotFoundError: If no SMBus/I2C busses are found and fail_on_no_smbus is True.
@@ -665,30 +888,27 @@ def perform_system_scan(test_data_mode: bool = False, fail_on_no_smbus: bool = F
             except Exception as e:
                 _debug_print(f"Dependency check failed: {e}")
 
-    # Best-effort module loading
-    load_modules()
-
-    # SMBus discovery
-    buses = find_smbus()
-    if not buses and not test_data_mode:
-        if fail_on_no_smbus:
-            raise SmbusNotFoundError("No SMBus/I2C busses detected.")
+    # Hardware probing is skipped entirely with test data
+    if not test_data_mode:
+        # Best-effort module loading
+        load_modules()
+
+        # SMBus discovery
+        buses = find_smbus()
+        if not buses:
+            if fail_on_no_smbus:
+                raise SmbusNotFoundError("No SMBus/I2C busses detected.")
+            else:
+                print(
+                    "Warning: No SMBus/I2C busses detected. "
+                    "Continuing; decode-dimms may still provide data.",
+                    file=sys.stderr,
+                )
         else:
-            print(
-                "Warning: No SMBus/I2C busses detected. "
-                "Continuing; decode-dimms may still provide data.",
-                file=sys.stderr,
-            )
-    elif buses and not test_data_mode:
-        # Collect and register
-        bus_address_pairs = []
-        for bus in buses:
-            addresses = scan_bus(bus)
-            if addresses:
-                bus_address_pairs.append((bus, addresses))
-        
-        for bus_id, addresses in bus_address_pairs:
-            register_devices(bus_id, addresses)
+            # Collect and register
+            for bus_id, addresses in scan_all_busses(buses).items():
+                if addresses:
+                    register_devices(bus_id, addresses)
 
     # Run decoder or use test data
     combined_output = ""
@@ -718,7 +938,7 @@ def perform_system_scan(test_data_mode: bool = False, fail_on_no_smbus: bool = F
         # Normal hardware detection
         try:
             _debug_print("perform_system_scan: invoking run_decoder()")
-            combined_output, raw_individual = run_decoder()
+            combined_output, raw_individual = run_decoder(refresh=refresh, raw_blocks=raw_blocks)
         except RuntimeError as e:
             if fail_on_no_smbus: # Proxy for non-interactive
                 # main exited with 8 here
@@ -734,45 +954,26 @@ def perform_system_scan(test_data_mode: bool = False, fail_on_no_smbus: bool = F
     # Parse
     dimms: List[Dict[str, Any]] = []
     if combined_output:
-        parsed = parse_output(combined_output)
-        
-        # Deduplicate
-        seen_keys = set()
-        deduped: List[Dict[str, Any]] = []
-        for d in parsed:
-            slot = str(d.get("slot", "")).strip().lower()
-            part = str(d.get("module_part_number", d.get("Part Number", ""))).strip().lower()
-            mfg = str(d.get("manufacturer", "")).strip().lower()
-            gen = str(d.get("generation", "")).strip().lower()
-            key = (slot, part, mfg, gen)
-            if key in seen_keys and any(key):
-                continue
-            seen_keys.add(key)
-            deduped.append(d)
-        dimms = deduped
-
-    # Load DB
-    db = load_die_database()
-
-    # Normalize and Resolve
-    for idx, dimm in enumerate(dimms):
-        if "slot" not in dimm:
-            dimm["slot"] = f"DIMM_{idx}"
-        norm = RamSleuth_DB.normalize_dimm_data(dimm)
-        dimm.update(norm)
-        
-    for dimm in dimms:
-        die_type, notes = RamSleuth_DB.find_die_type(dimm, db)
-        dimm["die_type"] = die_type
-        if notes:
-            dimm["notes"] = notes
-            
-    # Second pass normalization/resolution
-    for idx, dimm in enumerate(dimms):
-        dimm.update(RamSleuth_DB.normalize_dimm_data(dimm))
-        die_type, notes = RamSleuth_DB.find_die_type(dimm, db)
-        dimm["die_type"] = die_type
-        if notes:
-            dimm["notes"] = notes
+        dimms = deduplicate_dimms(parse_output(combined_output))
+
+    if dimms:
+        # Load DB only when there is something to resolve
+        db = load_die_database()
+        db_index = RamSleuth_DB.index_database(db)
+
+        # Normalize and Resolve in a single pass (normalization does not read "slot")
+        normalized = RamSleuth_DB.normalize_dimms_batch(dimms)
+        for idx, (dimm, norm) in enumerate(zip(dimms, normalized)):
+            dimm.setdefault("slot", f"DIMM_{idx}")
+            dimm.update(norm)
+            die_type, notes = RamSleuth_DB.find_die_type(dimm, db, db_index)
+            dimm["die_type"] = die_type
+            if notes:
+                dimm["notes"] = notes
+
+    # No second normalization pass: normalize_dimm_data() is idempotent on a
+    # DIMM that already carries its output, so re-running it (and the memoized
+    # lookup) could not change anything. Callers that add inputs later (e.g.
+    # lootbox prompts) re-normalize themselves.
 
     return dimms, raw_individual
\ No newline at end of file
@@ -1,12 +1,73 @@
 import sys
-import re
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from settings_service import SettingsService
+
+try:
+    import orjson  # Optional: native JSON encoding for --json output.
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 from .utils import _debug_print
 from .scanner import perform_system_scan, get_current_memory_settings
 
 
+# DIMM fields printed by output_full(), in display order.
+_FULL_KEYS_OF_INTEREST = (
+    "generation",
+    "module_gb",
+    "manufacturer",
+    "module_part_number",
+    "dram_mfg",
+    "module_ranks",
+    "chip_org",
+    "timings_xmp",
+    "timings_jdec",
+    "timings",
+    "voltage_xmp",
+    "configured_speed",
+    "configured_voltage",
+    "min_voltage",
+    "max_voltage",
+    "corsair_version",
+    "gskill_sticker_code",
+    "crucial_sticker_suffix",
+    "hynix_ic_part_number",
+)
+
+# Memory controller settings shown in the TUI settings pane: (key, label).
+# Labels are padded so the values line up.
+_SETTINGS_PANE_FIELDS = (
+    ("Size", "Size:               "),
+    ("JEDEC Speed", "JEDEC Speed:        "),
+    ("XMP Profile", "XMP Profile:        "),
+    ("Rated XMP", "Rated XMP:          "),
+    ("Configured Speed", "Configured Speed:   "),
+    ("Manufacturer", "Manufacturer:       "),
+    ("Part Number", "Part Number:        "),
+    ("XMP Timings", "XMP Timings:        "),
+    ("Configured Voltage", "Configured Voltage: "),
+)
+
+# Optional DDR5 / sticker fields in the TUI summary pane: (key, label).
+_DDR5_EXTRA_FIELDS = (
+    ("PMIC Manufacturer", "PMIC Manufacturer"),
+    ("hynix_ic_part_number", "Hynix IC Part Number"),
+    ("corsair_version", "Corsair Version"),
+    ("gskill_sticker_code", "G.Skill Sticker Code"),
+    ("crucial_sticker_suffix", "Crucial Sticker Suffix"),
+)
+
+
+def _settings_pane_lines(current_settings: Dict[str, Any]) -> List[str]:
+    """Return the settings pane lines for every field that is not "N/A"."""
+    lines = ["[b]Current Settings (from Memory Controller)[/b]"]
+    for key, label in _SETTINGS_PANE_FIELDS:
+        value = current_settings.get(key, "N/A")
+        if value != "N/A":
+            lines.append(f"{label}{value}")
+    return lines
+
+
 def output_summary(dimms: List[Dict[str, Any]]) -> None:
     """
     Print a concise, one-line summary per DIMM.
@@ -24,6 +85,8 @@ def output_summary(dimms: List[Dict[str, Any]]) -> None:
         print("No DIMMs detected.")
         return
 
+    # Build every line first and emit them with a single write.
+    lines = []
     for idx, dimm in enumerate(dimms):
         slot = dimm.get("slot", f"DIMM_{idx}")
         generation = dimm.get("generation", "?")
@@ -41,7 +104,8 @@ def output_summary(dimms: List[Dict[str, Any]]) -> None:
             line += f" [{timings}]"
         if notes:
             line += f" [{notes}]"
-        print(line)
+        lines.append(line)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def output_full(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> None:
@@ -58,49 +122,30 @@ def output_full(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) ->
         print("No DIMMs detected.")
         return
 
+    rule = "=" * 60
+    divider = "-" * 60
+    lines = []
     for idx, dimm in enumerate(dimms):
         slot = dimm.get("slot", f"DIMM_{idx}")
         die_type = dimm.get("die_type", "Unknown")
 
-        print("=" * 60)
-        print(f"{slot} :: Die Type: {die_type}")
+        lines.append(rule)
+        lines.append(f"{slot} :: Die Type: {die_type}")
         notes = dimm.get("notes")
         if notes:
-            print(f"Notes: {notes}")
-        print("-" * 60)
+            lines.append(f"Notes: {notes}")
+        lines.append(divider)
 
         # Key attributes
-        keys_of_interest = [
-            "generation",
-            "module_gb",
-            "manufacturer",
-            "module_part_number",
-            "dram_mfg",
-            "module_ranks",
-            "chip_org",
-            "timings_xmp",
-            "timings_jdec",
-            "timings",
-            "voltage_xmp",
-            "configured_speed",
-            "configured_voltage",
-            "min_voltage",
-            "max_voltage",
-            "corsair_version",
-            "gskill_sticker_code",
-            "crucial_sticker_suffix",
-            "hynix_ic_part_number",
-        ]
-        for k in keys_of_interest:
-            if k in dimm:
-                print(f"{k}: {dimm[k]}")
+        lines.extend(f"{k}: {dimm[k]}" for k in _FULL_KEYS_OF_INTEREST if k in dimm)
 
         # Raw decode-dimms block if available
-        raw_key = f"dimm_{idx}"
-        if raw_key in raw_individual:
-            print("-" * 60)
-            print(raw_individual[raw_key].rstrip())
-        print()
+        raw_block = raw_individual.get(f"dimm_{idx}")
+        if raw_block is not None:
+            lines.append(divider)
+            lines.append(raw_block.rstrip())
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def output_json(dimms: List[Dict[str, Any]]) -> None:
@@ -110,7 +155,103 @@ def output_json(dimms: List[Dict[str, Any]]) -> None:
     Requirements:
     - No extra logging or messages to stdout.
     """
-    print(json.dumps(dimms, indent=2))
+    if orjson is not None:
+        try:
+            data = orjson.dumps(dimms, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson.JSONEncodeError (a TypeError) on values the stdlib still
+            # accepts, such as non-str keys or integers wider than 64 bits.
+            data = None
+        if data is not None:
+            # Text-only streams (StringIO, redirect_stdout, some IDE consoles)
+            # have no underlying binary buffer.
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                sys.stdout.write(data.decode())
+                return
+            sys.stdout.flush()
+            buffer.write(data)
+            buffer.flush()
+            return
+    # Stream the encoder's chunks rather than building the whole document first.
+    json.dump(dimms, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def build_dimm_summary(dimm: Dict[str, Any], index: int) -> str:
+    """
+    Build the TUI summary pane text (Textual markup) for one DIMM.
+
+    index is the DIMM's position, used for the slot label when "slot" is
+    missing. Sections with nothing to show are left out.
+    """
+    get = dimm.get
+    notes = get("notes")
+    dram_mfg = get("dram_mfg")
+
+    # Every line goes straight into one flat list, joined once at the end;
+    # section headers carry their own leading blank line.
+    lines = [
+        # Identity section
+        "[b]Identity[/b]",
+        f"Slot: {get('slot', f'DIMM_{index}')}",
+        f"Manufacturer: {get('manufacturer', '?')}",
+        f"Part Number: {get('module_part_number', get('Part Number', '?'))}",
+        # Die Info section
+        "\n[b]Die Info[/b]",
+        f"Die Type: {get('die_type', 'Unknown')}",
+    ]
+    add = lines.append
+    if notes:
+        add(f"Notes: {notes}")
+    if dram_mfg:
+        add(f"DRAM Manufacturer: {dram_mfg}")
+
+    # Config section
+    lines += (
+        "\n[b]Config[/b]",
+        f"Generation: {get('generation', '?')}",
+        f"Capacity: {get('module_gb', '?')} GB",
+        f"Ranks: {get('module_ranks', '?')}",
+        f"Chip Organization: {get('chip_org', get('SDRAM Device Width', '?'))}",
+    )
+
+    # Timings section, only if we have actual timings
+    timings = get('timings')
+    timings_jdec = get('timings_jdec')
+    timings_xmp = get('timings_xmp')
+    if timings or timings_jdec or timings_xmp:
+        add("\n[b]Timings[/b]")
+        if timings:
+            add(f"Inferred: {timings}")
+        if timings_jdec:
+            add(f"JEDEC: {timings_jdec}")
+        if timings_xmp:
+            add(f"XMP/EXPO: {timings_xmp}")
+
+    # Voltage section
+    configured_voltage = get('configured_voltage')
+    min_voltage = get('min_voltage')
+    max_voltage = get('max_voltage')
+    if configured_voltage or min_voltage or max_voltage:
+        add("\n[b]Voltage[/b]")
+        if configured_voltage:
+            add(f"Configured: {configured_voltage}")
+        if min_voltage:
+            add(f"Min: {min_voltage}")
+        if max_voltage:
+            add(f"Max: {max_voltage}")
+
+    # DDR5 Extras section
+    ddr5_header_at = len(lines)
+    for key, label in _DDR5_EXTRA_FIELDS:
+        value = get(key)
+        if value and value != 'N/A':
+            add(f"{label}: {value}")
+    if len(lines) > ddr5_header_at:
+        lines.insert(ddr5_header_at, "\n[b]DDR5 Extras[/b]")
+
+    return "\n".join(lines)
 
 
 def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> None:
@@ -296,6 +437,11 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             self.active_tab = "summary"
             self.initial_theme = initial_theme
             self.settings = settings or SettingsService()
+            self._available_themes = None
+            # index -> (summary_text, full_text); valid until the data is replaced.
+            self._dimm_view_cache: Dict[int, Tuple[str, str]] = {}
+            # DIMMCard widgets currently mounted, in display order.
+            self._dimm_cards: List[DIMMCard] = []
 
         def compose(self) -> ComposeResult:  # type: ignore[override]
             yield Header(show_clock=False)
@@ -320,18 +466,27 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
 
         def on_mount(self) -> None:
             # DEBUG: Check initial theme state
-            _debug_print(f"on_mount: Initial self.theme = {getattr(self, 'theme', 'NOT_SET')}")
-            _debug_print(f"on_mount: Initial self.app.theme = {getattr(self.app, 'theme', 'NOT_SET')}")
-            _debug_print(f"on_mount: Initial dark = {getattr(self, 'dark', 'NOT_SET')}")
-            
-            # Apply the initial theme - support both old "dark/light" values and new theme names
-            self.settings.load_settings()  # Refresh settings from disk
+            _debug_print(lambda: f"on_mount: Initial self.theme = {getattr(self, 'theme', 'NOT_SET')}")
+            _debug_print(lambda: f"on_mount: Initial self.app.theme = {getattr(self.app, 'theme', 'NOT_SET')}")
+            _debug_print(lambda: f"on_mount: Initial dark = {getattr(self, 'dark', 'NOT_SET')}")
+            
+            # Look up the widgets that handlers touch once; compose() has built
+            # them by now, and the ids never change afterwards.
+            self._tabs = self.query_one("#detail_tabs", Tabs)
+            self._summary_pane = self.query_one("#summary_pane", Static)
+            self._full_pane = self.query_one("#full_pane", Static)
+            self._settings_pane = self.query_one("#current_settings_pane", Static)
+            self._dimm_selector = self.query_one("#dimm_selector_container", VerticalScroll)
+            self._right_scroll = self.query_one("#right_scroll", ScrollableContainer)
+            
+            # Apply the initial theme - support both old "dark/light" values and new theme names.
+            # self.settings was loaded when it was constructed, just before the app.
             saved_theme = self.settings.get_setting("theme", "dark")
             _debug_print(f"on_mount: Loading theme from config: '{saved_theme}'")
             
             # Validate theme against available themes
             available_themes = self.get_available_themes()
-            _debug_print(f"on_mount: Available Textual themes: {list(available_themes)}")
+            _debug_print(lambda: f"on_mount: Available Textual themes: {list(available_themes)}")
             
             # Handle both old boolean-style themes and new theme names
             if saved_theme in ["dark", "light"]:
@@ -362,8 +517,7 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             self.refresh_dimm_list()
             
             # Initialize the tabs and restore saved active tab
-            tabs = self.query_one("#detail_tabs", Tabs)
-            tabs.active = saved_active_tab
+            self._tabs.active = saved_active_tab
             self._update_pane_visibility()
             self.update_views(0)
             
@@ -380,56 +534,20 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             
             _debug_print(f"on_mount: dimms_data has {len(self.dimms_data)} entries")
             if self.dimms_data:
-                _debug_print(f"on_mount: First dimm data keys: {list(self.dimms_data[0].keys())}")
+                _debug_print(lambda: f"on_mount: First dimm data keys: {list(self.dimms_data[0].keys())}")
             
             # Get current settings with SPD output and DIMM data for XMP extraction
             current_settings = get_current_memory_settings(spd_output=spd_output, dimms_data=self.dimms_data)
-            _debug_print(f"on_mount: get_current_memory_settings returned {current_settings}")
-            settings_pane = self.query_one("#current_settings_pane", Static)
+            _debug_print(lambda: f"on_mount: get_current_memory_settings returned {current_settings}")
+            settings_pane = self._settings_pane
             
             # Build settings text with all available fields
-            settings_lines = ["[b]Current Settings (from Memory Controller)[/b]"]
-            
-            # Always show Size if available
-            if "Size" in current_settings and current_settings["Size"] != "N/A":
-                settings_lines.append(f"Size:               {current_settings['Size']}")
-            
-            # Show JEDEC Speed (from SPD/dmidecode)
-            if "JEDEC Speed" in current_settings and current_settings["JEDEC Speed"] != "N/A":
-                settings_lines.append(f"JEDEC Speed:        {current_settings['JEDEC Speed']}")
-            
-            # Show XMP Profile Speed (Active)
-            if "XMP Profile" in current_settings and current_settings["XMP Profile"] != "N/A":
-                settings_lines.append(f"XMP Profile:        {current_settings['XMP Profile']}")
-            
-            # Show Rated XMP (capabilities)
-            if "Rated XMP" in current_settings and current_settings["Rated XMP"] != "N/A":
-                settings_lines.append(f"Rated XMP:          {current_settings['Rated XMP']}")
-            
-            # Show Configured Speed (current actual speed)
-            if "Configured Speed" in current_settings and current_settings["Configured Speed"] != "N/A":
-                settings_lines.append(f"Configured Speed:   {current_settings['Configured Speed']}")
-            
-            # Show Manufacturer
-            if "Manufacturer" in current_settings and current_settings["Manufacturer"] != "N/A":
-                settings_lines.append(f"Manufacturer:       {current_settings['Manufacturer']}")
-            
-            # Show Part Number
-            if "Part Number" in current_settings and current_settings["Part Number"] != "N/A":
-                settings_lines.append(f"Part Number:        {current_settings['Part Number']}")
-            
-            # Show XMP Timings
-            if "XMP Timings" in current_settings and current_settings["XMP Timings"] != "N/A":
-                settings_lines.append(f"XMP Timings:        {current_settings['XMP Timings']}")
-            
-            # Show Configured Voltage
-            if "Configured Voltage" in current_settings and current_settings["Configured Voltage"] != "N/A":
-                settings_lines.append(f"Configured Voltage: {current_settings['Configured Voltage']}")
+            settings_lines = _settings_pane_lines(current_settings)
             
             # Join all lines
             settings_text = "\n".join(settings_lines)
             
-            _debug_print(f"on_mount: updating settings pane with text: {settings_text}")
+            _debug_print(lambda: f"on_mount: updating settings pane with text: {settings_text}")
             settings_pane.update(settings_text)
             _debug_print("on_mount: settings pane updated successfully")
 
@@ -438,21 +556,18 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
 
         def action_toggle_dark(self) -> None:
             """
-            Toggle dark mode and save the setting.
+            Toggle dark mode.
             
             This method is bound to Ctrl+T and provides the primary theme toggle
-            functionality. It switches between dark and light themes and immediately
-            persists the new setting to the config file.
+            functionality. It switches between dark and light themes.
             
             The toggle works by:
             1. Determining the new theme state (dark or light)
             2. Setting self.app.theme to the new value
-            3. Loading current config, updating the theme key, and saving
             
             Persistence:
+                - Handled by watch_theme, which fires on the assignment above
                 - Saves to ~/.config/ramsleuth/ramsleuth_config.json
-                - Works correctly with sudo (saves to original user's home)
-                - Changes are immediate, not deferred until exit
             """
             try:
                 # Determine the new theme
@@ -468,36 +583,24 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
                 
                 _debug_print(f"action_toggle_dark: Theme changed to: {new_theme}")
                 
-                # Save via SettingsService
-                self.settings.set_setting("theme", new_theme)
-                
-                _debug_print(f"action_toggle_dark: Theme saved to config successfully")
-                
             except Exception as e:
                 _debug_print(f"action_toggle_dark: Error toggling theme: {e}")
                 import traceback
-                _debug_print(f"action_toggle_dark: traceback: {traceback.format_exc()}")
+                _debug_print(lambda: f"action_toggle_dark: traceback: {traceback.format_exc()}")
                 print(f"Error: Failed to toggle theme: {e}", file=sys.stderr)
 
         def watch_dark(self, dark: bool) -> None:
             """
-            Watches for changes to the dark mode setting and persists them.
+            Watches for changes to the dark mode setting.
             
-            This method is automatically called by Textual whenever the dark property
-            changes, ensuring that ALL theme changes (from any source) are captured
-            and persisted to the config file.
-            
-            This includes:
-            - Ctrl+T toggles
-            - Command palette theme selections
-            - Any other theme changes made through Textual's built-in mechanisms
+            Persistence is left to watch_theme: dark only mirrors the active theme,
+            and saving "dark"/"light" here would overwrite a named theme such as
+            "tokyo-night" that was just saved.
             
             Args:
                 dark: The new dark mode state (True for dark, False for light)
             """
-            new_theme = "dark" if dark else "light"
-            _debug_print(f"watch_dark: Theme changed to: {new_theme}, saving to config.")
-            self.settings.set_setting("theme", new_theme)
+            _debug_print(f"watch_dark: dark mode changed to: {dark}")
 
         def watch_theme(self, theme: str) -> None:
             """
@@ -520,23 +623,29 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             except Exception as e:
                 _debug_print(f"watch_theme: Error saving theme: {e}")
                 import traceback
-                _debug_print(f"watch_theme: traceback: {traceback.format_exc()}")
+                _debug_print(lambda: f"watch_theme: traceback: {traceback.format_exc()}")
                 print(f"Error: Failed to save theme setting: {e}", file=sys.stderr)
 
         def get_available_themes(self) -> set:
             """
             Get the set of available themes from Textual.
             
+            The app registers no themes of its own, so the set is built on the
+            first call and reused afterwards.
+            
             Returns:
                 A set of available theme names
             """
+            if self._available_themes is not None:
+                return self._available_themes
             try:
                 # Textual provides available themes through the app
                 if hasattr(self.app, 'available_themes'):
-                    return set(self.app.available_themes)
+                    self._available_themes = set(self.app.available_themes)
                 else:
                     # Fallback to basic themes if available_themes not accessible
-                    return {"dark", "light"}
+                    self._available_themes = {"dark", "light"}
+                return self._available_themes
             except Exception as e:
                 _debug_print(f"get_available_themes: Error getting available themes: {e}")
                 # Return basic themes as fallback
@@ -548,21 +657,22 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             
             This method handles theme changes from Textual's built-in command palette
             and other sources. It supports both old "dark/light" values and new
-            theme names like "tokyo-night", "solarized-dark", etc.
+            theme names like "tokyo-night", "solarized-dark", etc. The new theme is
+            persisted by watch_theme.
             
             Args:
                 theme: The theme name to set (e.g., "dark", "light", "tokyo-night")
             """
             _debug_print(f"action_set_theme: Called with theme = {theme}")
-            _debug_print(f"action_set_theme: Before change - self.theme = {getattr(self, 'theme', 'NOT_SET')}")
-            _debug_print(f"action_set_theme: Before change - self.app.theme = {getattr(self.app, 'theme', 'NOT_SET')}")
+            _debug_print(lambda: f"action_set_theme: Before change - self.theme = {getattr(self, 'theme', 'NOT_SET')}")
+            _debug_print(lambda: f"action_set_theme: Before change - self.app.theme = {getattr(self.app, 'theme', 'NOT_SET')}")
             
             try:
                 _debug_print(f"action_set_theme: Attempting to set theme to '{theme}'")
                 
                 # Validate theme against available themes
                 available_themes = self.get_available_themes()
-                _debug_print(f"action_set_theme: Available themes: {available_themes}")
+                _debug_print(lambda: f"action_set_theme: Available themes: {available_themes}")
                 
                 if theme not in available_themes and theme not in ["dark", "light"]:
                     _debug_print(f"action_set_theme: Invalid theme '{theme}' not in available themes")
@@ -572,18 +682,14 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
                 # Apply the theme
                 self.app.theme = theme
                 self.refresh_css()
-                _debug_print(f"action_set_theme: After change - self.theme = {getattr(self, 'theme', 'NOT_SET')}")
-                _debug_print(f"action_set_theme: After change - self.app.theme = {getattr(self.app, 'theme', 'NOT_SET')}")
+                _debug_print(lambda: f"action_set_theme: After change - self.theme = {getattr(self, 'theme', 'NOT_SET')}")
+                _debug_print(lambda: f"action_set_theme: After change - self.app.theme = {getattr(self.app, 'theme', 'NOT_SET')}")
                 _debug_print(f"action_set_theme: Theme successfully changed to: {theme}")
                 
-                # Save the new state
-                self.settings.set_setting("theme", theme)
-                _debug_print(f"action_set_theme: Theme saved to config")
-                
             except Exception as e:
                 _debug_print(f"action_set_theme: Error setting theme '{theme}': {e}")
                 import traceback
-                _debug_print(f"action_set_theme: traceback: {traceback.format_exc()}")
+                _debug_print(lambda: f"action_set_theme: traceback: {traceback.format_exc()}")
                 print(f"Error: Failed to set theme '{theme}': {e}", file=sys.stderr)
                 
                 # Fallback to default theme on error
@@ -592,19 +698,16 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
                     self.app.theme = "dark"
                     self.dark = True
                     self.refresh_css()
-                    self.settings.set_setting("theme", "dark")
                     print("Warning: Using fallback 'dark' theme due to error", file=sys.stderr)
                 except Exception as fallback_error:
                     _debug_print(f"action_set_theme: Fallback also failed: {fallback_error}")
 
         def action_show_summary(self) -> None:
-            tabs = self.query_one("#detail_tabs", Tabs)
-            tabs.active = "summary_tab"
+            self._tabs.active = "summary_tab"
             self._update_pane_visibility()
 
         def action_show_full(self) -> None:
-            tabs = self.query_one("#detail_tabs", Tabs)
-            tabs.active = "full_tab"
+            self._tabs.active = "full_tab"
             self._update_pane_visibility()
             
         def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -621,6 +724,7 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
 
             self.dimms_data = new_dimms
             self.raw_data = new_raw
+            self._dimm_view_cache.clear()
             
             # Refresh UI
             self.refresh_dimm_list()
@@ -635,13 +739,17 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             self.app.call_from_thread(self.notify, "Scanning system...", title="Rescan")
             try:
                 # We force test_data_mode=False for a real rescan
-                new_dimms, new_raw = perform_system_scan(test_data_mode=False, fail_on_no_smbus=False)
+                new_dimms, new_raw = perform_system_scan(
+                    test_data_mode=False, fail_on_no_smbus=False, refresh=True
+                )
                 
                 # Fetch settings in background to avoid blocking main thread
                 spd_output = ""
                 if new_raw and "dimm_0" in new_raw:
                     spd_output = new_raw["dimm_0"]
-                new_settings = get_current_memory_settings(spd_output=spd_output, dimms_data=new_dimms)
+                new_settings = get_current_memory_settings(
+                    spd_output=spd_output, dimms_data=new_dimms, refresh=True
+                )
 
                 self.app.call_from_thread(self.finish_rescan, new_dimms, new_raw, new_settings)
             except Exception as e:
@@ -661,18 +769,19 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
                 
         def refresh_dimm_list(self) -> None:
             """Re-populate the DIMM selector list with cards."""
-            container = self.query_one("#dimm_selector_container", VerticalScroll)
+            container = self._dimm_selector
             
             # Clear existing cards (keeping the static title/settings)
             # A safer way is to remove all DIMMCards specifically
-            for child in container.query("DIMMCard"):
-                child.remove()
+            container.query("DIMMCard").remove()
                 
-            for idx, dimm in enumerate(self.dimms_data):
-                card = DIMMCard(dimm, idx)
-                container.mount(card)
-                if idx == 0:
-                    card.set_selected(True)
+            # Mount all cards in one call so the container lays out once,
+            # rather than once per DIMM.
+            cards = [DIMMCard(dimm, idx) for idx, dimm in enumerate(self.dimms_data)]
+            self._dimm_cards = cards
+            if cards:
+                cards[0].set_selected(True)
+                container.mount(*cards)
 
         def refresh_settings_pane(self, settings: Dict[str, str] = None) -> None:
             """Update the settings pane with fresh data."""
@@ -684,32 +793,9 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
                     spd_output = self.raw_data["dimm_0"]
                 current_settings = get_current_memory_settings(spd_output=spd_output, dimms_data=self.dimms_data)
 
-            settings_pane = self.query_one("#current_settings_pane", Static)
-            
-            # (Reuse the logic from on_mount - ideally refactored, but duplicating for safety/speed)
-            settings_lines = ["[b]Current Settings (from Memory Controller)[/b]"]
-            
-            if "Size" in current_settings and current_settings["Size"] != "N/A":
-                settings_lines.append(f"Size:               {current_settings['Size']}")
-            if "JEDEC Speed" in current_settings and current_settings["JEDEC Speed"] != "N/A":
-                settings_lines.append(f"JEDEC Speed:        {current_settings['JEDEC Speed']}")
-            if "XMP Profile" in current_settings and current_settings["XMP Profile"] != "N/A":
-                settings_lines.append(f"XMP Profile:        {current_settings['XMP Profile']}")
-            
-            # Show Rated XMP (capabilities)
-            if "Rated XMP" in current_settings and current_settings["Rated XMP"] != "N/A":
-                settings_lines.append(f"Rated XMP:          {current_settings['Rated XMP']}")
-
-            if "Configured Speed" in current_settings and current_settings["Configured Speed"] != "N/A":
-                settings_lines.append(f"Configured Speed:   {current_settings['Configured Speed']}")
-            if "Manufacturer" in current_settings and current_settings["Manufacturer"] != "N/A":
-                settings_lines.append(f"Manufacturer:       {current_settings['Manufacturer']}")
-            if "Part Number" in current_settings and current_settings["Part Number"] != "N/A":
-                settings_lines.append(f"Part Number:        {current_settings['Part Number']}")
-            if "XMP Timings" in current_settings and current_settings["XMP Timings"] != "N/A":
-                settings_lines.append(f"XMP Timings:        {current_settings['XMP Timings']}")
-            if "Configured Voltage" in current_settings and current_settings["Configured Voltage"] != "N/A":
-                settings_lines.append(f"Configured Voltage: {current_settings['Configured Voltage']}")
+            settings_pane = self._settings_pane
+            
+            settings_lines = _settings_pane_lines(current_settings)
             
             # Add Active Profile info (Real Timings)
             if "Active Profile" in current_settings and current_settings["Active Profile"] != "Unknown":
@@ -724,28 +810,21 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
         def action_toggle_pane_focus(self) -> None:
             """Toggle focus between the DIMM selector list and the right scrollable pane"""
             try:
-                dimm_container = self.query_one("#dimm_selector_container", VerticalScroll)
-                right_scroll = self.query_one("#right_scroll", ScrollableContainer)
-                
-                if dimm_container.has_focus:
-                    right_scroll.focus()
+                if self._dimm_selector.has_focus:
+                    self._right_scroll.focus()
                 else:
-                    dimm_container.focus()
+                    self._dimm_selector.focus()
             except Exception as e:
                 _debug_print(f"action_toggle_pane_focus: exception occurred: {e}")
 
         def _update_pane_visibility(self) -> None:
             """Update pane visibility based on active tab"""
             try:
-                tabs = self.query_one("#detail_tabs", Tabs)
-                summary_pane = self.query_one("#summary_pane", Static)
-                full_pane = self.query_one("#full_pane", Static)
-                
-                active_tab = tabs.active
-                summary_pane.display = active_tab == "summary_tab"
-                full_pane.display = active_tab == "full_tab"
+                active_tab = self._tabs.active
+                self._summary_pane.display = active_tab == "summary_tab"
+                self._full_pane.display = active_tab == "full_tab"
             except Exception:
-                # Widgets might not be mounted yet
+                # Widgets might not be mounted (and cached) yet
                 pass
 
         def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
@@ -763,7 +842,7 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             self.move_selection(1)
             
         def move_selection(self, delta: int) -> None:
-            cards = self.query("DIMMCard")
+            cards = self._dimm_cards
             if not cards:
                 return
                 
@@ -787,7 +866,7 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             self.update_views(message.card.index)
             
             # Update visual selection state
-            for card in self.query("DIMMCard"):
+            for card in self._dimm_cards:
                 card.set_selected(card == message.card)
 
         def update_views(self, index: int) -> None:
@@ -797,85 +876,18 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
             if index < 0 or index >= len(self.dimms_data):
                 index = 0
 
-            dimm = self.dimms_data[index]
-            slot = dimm.get("slot", f"DIMM_{index}")
-            die_type = dimm.get("die_type", "Unknown")
-            notes = dimm.get("notes") or ""
-
-            # Summary content - structured sections
-            summary_sections = []
-            
-            # Identity section
-            identity_lines = [
-                f"[b]Identity[/b]",
-                f"Slot: {slot}",
-                f"Manufacturer: {dimm.get('manufacturer', '?')}",
-                f"Part Number: {dimm.get('module_part_number', dimm.get('Part Number', '?'))}",
-            ]
-            summary_sections.extend(identity_lines)
-            
-            # Die Info section
-            die_lines = [
-                f"\n[b]Die Info[/b]",
-                f"Die Type: {die_type}",
-            ]
-            if notes:
-                die_lines.append(f"Notes: {notes}")
-            if dimm.get('dram_mfg'):
-                die_lines.append(f"DRAM Manufacturer: {dimm.get('dram_mfg')}")
-            summary_sections.extend(die_lines)
-            
-            # Config section
-            config_lines = [
-                f"\n[b]Config[/b]",
-                f"Generation: {dimm.get('generation', '?')}",
-                f"Capacity: {dimm.get('module_gb', '?')} GB",
-                f"Ranks: {dimm.get('module_ranks', '?')}",
-                f"Chip Organization: {dimm.get('chip_org', dimm.get('SDRAM Device Width', '?'))}",
-            ]
-            summary_sections.extend(config_lines)
-            
-            # Timings section
-            timings_lines = [f"\n[b]Timings[/b]"]
-            if dimm.get('timings'):
-                timings_lines.append(f"Inferred: {dimm.get('timings')}")
-            if dimm.get('timings_jdec'):
-                timings_lines.append(f"JEDEC: {dimm.get('timings_jdec')}")
-            if dimm.get('timings_xmp'):
-                timings_lines.append(f"XMP/EXPO: {dimm.get('timings_xmp')}")
-            if len(timings_lines) > 1:  # Only add if we have actual timings
-                summary_sections.extend(timings_lines)
-
-            # Voltage section
-            voltage_lines = []
-            if dimm.get('configured_voltage') or dimm.get('min_voltage') or dimm.get('max_voltage'):
-                voltage_lines.append(f"\n[b]Voltage[/b]")
-                if dimm.get('configured_voltage'):
-                     voltage_lines.append(f"Configured: {dimm.get('configured_voltage')}")
-                if dimm.get('min_voltage'):
-                     voltage_lines.append(f"Min: {dimm.get('min_voltage')}")
-                if dimm.get('max_voltage'):
-                     voltage_lines.append(f"Max: {dimm.get('max_voltage')}")
-                summary_sections.extend(voltage_lines)
-            
-            # DDR5 Extras section
-            ddr5_extras = []
-            if dimm.get('PMIC Manufacturer') and dimm.get('PMIC Manufacturer') != 'N/A':
-                ddr5_extras.append(f"PMIC Manufacturer: {dimm.get('PMIC Manufacturer')}")
-            if dimm.get('hynix_ic_part_number') and dimm.get('hynix_ic_part_number') != 'N/A':
-                ddr5_extras.append(f"Hynix IC Part Number: {dimm.get('hynix_ic_part_number')}")
-            if dimm.get('corsair_version') and dimm.get('corsair_version') != 'N/A':
-                ddr5_extras.append(f"Corsair Version: {dimm.get('corsair_version')}")
-            if dimm.get('gskill_sticker_code') and dimm.get('gskill_sticker_code') != 'N/A':
-                ddr5_extras.append(f"G.Skill Sticker Code: {dimm.get('gskill_sticker_code')}")
-            if dimm.get('crucial_sticker_suffix') and dimm.get('crucial_sticker_suffix') != 'N/A':
-                ddr5_extras.append(f"Crucial Sticker Suffix: {dimm.get('crucial_sticker_suffix')}")
-            
-            if ddr5_extras:
-                summary_sections.append(f"\n[b]DDR5 Extras[/b]")
-                summary_sections.extend(ddr5_extras)
-
-            summary_text = "\n".join(summary_sections)
+            views = self._dimm_view_cache.get(index)
+            if views is None:
+                views = self._dimm_view_cache[index] = self._build_dimm_views(index)
+            summary_text, full_text = views
+
+            # Update both panes
+            self._summary_pane.update(summary_text)
+            self._full_pane.update(full_text)
+
+        def _build_dimm_views(self, index: int) -> Tuple[str, str]:
+            """Build the summary and full pane text for the DIMM at index."""
+            summary_text = build_dimm_summary(self.dimms_data[index], index)
 
             # Full dump content (summary + raw block)
             raw_key = f"dimm_{index}"
@@ -888,13 +900,7 @@ def launch_tui(dimms: List[Dict[str, Any]], raw_individual: Dict[str, str]) -> N
                 full_lines.append("No raw data available")
             
             full_text = "\n".join(full_lines)
-
-            # Update both panes
-            summary_pane = self.query_one("#summary_pane", Static)
-            full_pane = self.query_one("#full_pane", Static)
-            
-            summary_pane.update(summary_text)
-            full_pane.update(full_text)
+            return summary_text, full_text
 
     app = RamSleuthApp(dimms, raw_individual, initial_theme=initial_theme, settings=settings_service)
     app.run()
\ No newline at end of file
@@ -2,22 +2,30 @@ import sys
 import os
 import json
 import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Union
 import RamSleuth_DB
 
 DEBUG = False
 
+# Shell/markup metacharacters stripped from user-entered sticker codes.
+_RE_STICKER_UNSAFE = re.compile(r'[<>&|;"`\x00]')
+
 def set_debug(value: bool) -> None:
     global DEBUG
     DEBUG = value
 
-def _debug_print(msg: str) -> None:
+def _debug_print(msg: Union[str, Callable[[], str]]) -> None:
     """
     Lightweight debug logger controlled by the global DEBUG flag.
 
     This avoids importing logging and keeps behavior deterministic/minimal.
+    For messages that are costly to build (large reprs, tracebacks), pass a
+    zero-argument callable; it is only invoked when DEBUG is enabled.
     """
     if DEBUG:
+        if callable(msg):
+            msg = msg()
         print(f"[RamSleuth:DEBUG] {msg}", file=sys.stderr)
 
 def check_root() -> None:
@@ -46,12 +54,15 @@ def check_root() -> None:
         )
         sys.exit(1)
 
+@lru_cache(maxsize=1)
 def load_die_database() -> List[Dict[str, Any]]:
     """
     Wrapper around RamSleuth_DB.load_database() with CLI-safe error handling.
 
     Behavior:
-    - On success: return loaded database list.
+    - On success: return loaded database list. The file is read and parsed
+      once per process; later calls (lootbox re-resolution, TUI rescans)
+      share the same list, which callers must treat as read-only.
     - On FileNotFoundError:
         - Print fatal error and exit(4).
     - On JSON/Value errors:
@@ -73,6 +84,18 @@ def load_die_database() -> List[Dict[str, Any]]:
         )
         sys.exit(4)
 
+# Manufacturer-triggered sticker prompts, asked in this order:
+# (vendor token, required lowercase part number or None, prompt brand,
+#  DIMM key for the answer).
+_STICKER_MANUFACTURER_RULES = (
+    ("corsair", None, "Corsair", "corsair_version"),
+    ("gskill", None, "G.Skill", "gskill_sticker_code"),
+    ("crucial", "bl2k16g36c16u4b", "Crucial_Lootbox", "crucial_sticker_suffix"),
+)
+# All vendor tokens in one pass over the lowercased manufacturer; "g.skill"
+# and "gskill" both yield the "gskill" token once the dot is dropped.
+_RE_STICKER_VENDOR = re.compile(r"corsair|g\.?skill|crucial")
+
 def prompt_for_sticker_code(dimm_index: int, brand: str) -> str:
     """
     Prompt user for brand-specific sticker/IC codes (interactive only).
@@ -118,7 +141,7 @@ def prompt_for_sticker_code(dimm_index: int, brand: str) -> str:
             _debug_print(f"prompt_for_sticker_code: Invalid input type received: {type(value)}")
             return ""
         # Sanitize input - remove potentially dangerous characters
-        sanitized_value = re.sub(r'[<>&|;"`\x00]', '', value)
+        sanitized_value = _RE_STICKER_UNSAFE.sub('', value)
         if sanitized_value != value:
             _debug_print(f"prompt_for_sticker_code: Input sanitized from '{value}' to '{sanitized_value}'")
         return sanitized_value.strip()
@@ -129,7 +152,7 @@ def prompt_for_sticker_code(dimm_index: int, brand: str) -> str:
         _debug_print(f"prompt_for_sticker_code: Unexpected error during input: {e}")
         return ""
 
-def apply_lootbox_prompts(dimms: List[Dict[str, Any]], interactive: bool) -> None:
+def apply_lootbox_prompts(dimms: List[Dict[str, Any]], interactive: bool) -> List[int]:
     """
     Optionally enrich DIMM metadata with user-supplied sticker/IC codes.
 
@@ -155,37 +178,50 @@ def apply_lootbox_prompts(dimms: List[Dict[str, Any]], interactive: bool) -> Non
         * If dimm["dram_mfg"] contains "Hynix" (ci)
           AND normalized generation indicates DDR5, then
           prompt_for_sticker_code(..., "Hynix_IC") -> hynix_ic_part_number.
+
+    Returns:
+        Indices of the DIMMs that received at least one code; only these need
+        re-normalizing and re-resolving.
     """
+    enriched: List[int] = []
     if not interactive:
-        return
+        return enriched
 
+    # DIMM fields are str (parse_output() and normalize_dimm_data() only
+    # store strings), so they are read without coercion.
     for idx, dimm in enumerate(dimms):
-        manufacturer = str(dimm.get("manufacturer", "")).lower()
-        part_number = str(dimm.get("module_part_number", "")).lower()
-        dram_mfg = str(dimm.get("dram_mfg", "")).lower()
-        generation = str(dimm.get("generation", "")).upper()
-        is_ddr5 = "DDR5" in generation
-
-        # Corsair
-        if "corsair" in manufacturer:
-            code = prompt_for_sticker_code(idx, "Corsair")
+        manufacturer = dimm.get("manufacturer", "").lower()
+        dram_mfg = dimm.get("dram_mfg", "").lower()
+        has_hynix = "hynix" in dram_mfg
+        vendors = {m.group(0).replace(".", "") for m in _RE_STICKER_VENDOR.finditer(manufacturer)}
+        # Most modules trigger no prompt at all; skip the remaining fields.
+        if not vendors and not has_hynix:
+            continue
+
+        # Corsair, G.Skill, Crucial Lootbox (BL2K16G36C16U4B only, strict)
+        got_code = False
+        part_number = None
+        for vendor, required_part, brand, key in _STICKER_MANUFACTURER_RULES:
+            if vendor not in vendors:
+                continue
+            if required_part is not None:
+                if part_number is None:
+                    part_number = dimm.get("module_part_number", "").lower()
+                if part_number != required_part:
+                    continue
+            code = prompt_for_sticker_code(idx, brand)
             if code:
-                dimm["corsair_version"] = code
-
-        # G.Skill
-        if "g.skill" in manufacturer or "gskill" in manufacturer:
-            code = prompt_for_sticker_code(idx, "G.Skill")
-            if code:
-                dimm["gskill_sticker_code"] = code
-
-        # Crucial Lootbox (BL2K16G36C16U4B only, strict)
-        if "crucial" in manufacturer and part_number == "bl2k16g36c16u4b":
-            code = prompt_for_sticker_code(idx, "Crucial_Lootbox")
-            if code:
-                dimm["crucial_sticker_suffix"] = code
+                dimm[key] = code
+                got_code = True
 
         # Hynix DDR5 IC P/N
-        if "hynix" in dram_mfg and is_ddr5:
+        if has_hynix and "DDR5" in dimm.get("generation", "").upper():
             code = prompt_for_sticker_code(idx, "Hynix_IC")
             if code:
-                dimm["hynix_ic_part_number"] = code
\ No newline at end of file
+                dimm["hynix_ic_part_number"] = code
+                got_code = True
+
+        if got_code:
+            enriched.append(idx)
+
+    return enriched
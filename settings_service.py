@@ -19,16 +19,34 @@ Features:
 
 import json
 import os
-import pwd
-import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson  # Optional: faster JSON encode/decode straight from bytes.
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 
 # Type alias for settings dictionary
 SettingsDict = Dict[str, Any]
 
 
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes (orjson when available, else the stdlib)."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode obj as 2-space indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
 class SettingsService:
     """
     Centralized settings management service for RamSleuth.
@@ -64,6 +82,11 @@ class SettingsService:
         "default_view_tab": lambda x: x in ["summary", "full"]
     }
     
+    # Parsed config files shared by all instances: path -> (stat signature,
+    # settings). Repeated SettingsService()/load_config() calls skip the
+    # re-read and JSON parse while the file is unchanged on disk.
+    _load_cache: Dict[Path, Tuple[Tuple[int, int, int, int], SettingsDict]] = {}
+    
     def __init__(self, debug: bool = False) -> None:
         """
         Initialize the SettingsService.
@@ -130,6 +153,8 @@ class SettingsService:
         """
         # When running with sudo, use the original user's home directory
         if os.environ.get('SUDO_USER'):
+            import pwd
+            
             sudo_user = os.environ['SUDO_USER']
             try:
                 user_home = pwd.getpwnam(sudo_user).pw_dir
@@ -146,14 +171,17 @@ class SettingsService:
         # Default to ~/.config
         return Path.home() / ".config"
     
-    def _debug_print(self, message: str) -> None:
+    def _debug_print(self, message: Union[str, Callable[[], str]]) -> None:
         """
         Print debug message if debug mode is enabled.
         
         Args:
-            message: Debug message to print
+            message: Debug message to print, or a zero-argument callable
+                returning it (only called when debug mode is enabled)
         """
         if self.debug:
+            if callable(message):
+                message = message()
             print(f"[SettingsService:DEBUG] {message}", file=sys.stderr)
     
     def load_settings(self) -> None:
@@ -172,14 +200,24 @@ class SettingsService:
             self._settings = self.DEFAULT_SETTINGS.copy()
             return
         
-        if not self._config_file.exists():
+        # A single stat() both checks for the file and keys the parse cache
+        try:
+            stat = os.stat(self._config_file)
+        except OSError:
             self._debug_print(f"load_settings: config file not found at {self._config_file}")
             self._settings = self.DEFAULT_SETTINGS.copy()
             return
         
         try:
-            with open(self._config_file, 'r', encoding='utf-8') as f:
-                loaded_settings = json.load(f)
+            signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+            cached = self._load_cache.get(self._config_file)
+            if cached is not None and cached[0] == signature:
+                self._settings = cached[1].copy()
+                self._debug_print(f"load_settings: using cached settings for unchanged {self._config_file}")
+                return
+            
+            with open(self._config_file, 'rb') as f:
+                loaded_settings = _json_loads(f.read())
                 self._settings = loaded_settings
                 self._debug_print(f"load_settings: successfully loaded {len(loaded_settings)} settings")
                 
@@ -188,6 +226,9 @@ class SettingsService:
                     if key not in self._settings:
                         self._settings[key] = default_value
                         self._debug_print(f"load_settings: added missing default setting '{key}={default_value}'")
+            
+            if isinstance(self._settings, dict):
+                self._load_cache[self._config_file] = (signature, self._settings.copy())
                 
         except json.JSONDecodeError as e:
             self._debug_print(f"load_settings: JSON decode error in {self._config_file}: {e}")
@@ -205,6 +246,7 @@ class SettingsService:
         
         Creates the configuration directory if it doesn't exist.
         When running with sudo, changes file ownership to the original user.
+        Does nothing if the file on disk already matches the current settings.
         
         Side Effects:
             Writes configuration file to disk
@@ -215,12 +257,26 @@ class SettingsService:
             return
         
         try:
+            new_bytes = _json_dumps(self._settings)
+            
+            # Skip the write (and the chown below) if the file already holds
+            # exactly these settings.
+            try:
+                with open(self._config_file, 'rb') as f:
+                    unchanged = f.read() == new_bytes
+            except OSError:
+                unchanged = False
+            if unchanged:
+                self._debug_print(f"save_settings: {self._config_file} already up to date, not rewriting")
+                return
+            
             # Create directory if it doesn't exist
             self._config_dir.mkdir(parents=True, exist_ok=True)
             
             # Save settings to file
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2)
+            self._load_cache.pop(self._config_file, None)
+            with open(self._config_file, 'wb') as f:
+                f.write(new_bytes)
             
             self._debug_print(f"save_settings: successfully saved {len(self._settings)} settings to {self._config_file}")
             
@@ -245,6 +301,10 @@ class SettingsService:
         if not os.environ.get('SUDO_USER'):
             return
         
+        # Only needed under sudo, so not imported at module load
+        import pwd
+        import subprocess
+        
         try:
             sudo_user = os.environ['SUDO_USER']
             user_info = pwd.getpwnam(sudo_user)
@@ -269,7 +329,7 @@ class SettingsService:
         except Exception as e:
             self._debug_print(f"_handle_sudo_ownership: failed to change ownership: {e}")
             import traceback
-            self._debug_print(f"_handle_sudo_ownership: traceback: {traceback.format_exc()}")
+            self._debug_print(lambda: f"_handle_sudo_ownership: traceback: {traceback.format_exc()}")
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
@@ -298,7 +358,8 @@ class SettingsService:
     
     def set_setting(self, key: str, value: Any) -> bool:
         """
-        Set a setting value and save immediately.
+        Set a setting value and save immediately (no write if it is unchanged
+        and the config file already exists).
         
         Args:
             key: Setting key to set
@@ -322,6 +383,17 @@ class SettingsService:
             self._debug_print(f"set_setting: validation failed for key='{key}', value={value}")
             return False
         
+        # Nothing to write if the value is unchanged and already on disk; theme
+        # and tab handlers fire repeatedly with the same value.
+        if (
+            key in self._settings
+            and self._settings[key] == value
+            and self._config_file is not None
+            and self._config_file.exists()
+        ):
+            self._debug_print(f"set_setting: '{key}' already {value}, skipping save")
+            return True
+
         # Update the setting
         old_value = self._settings.get(key)
         self._settings[key] = value
@@ -1,6 +1,8 @@
+import json
+
 import pytest
 
-from RamSleuth_DB import is_match, normalize_dimm_data, load_database, find_die_type
+from RamSleuth_DB import is_match, normalize_dimm_data, load_database, find_die_type, index_database
 
 
 def base_dimm(**overrides):
@@ -80,6 +82,11 @@ def test_match_module_gb_numeric():
     entry = {"module_gb": 32}
     assert is_match(dimm, entry) is False
 
+    # Float rounding from MB -> GB conversion must not break equality.
+    dimm = base_dimm(module_gb=0.1 + 0.2)
+    assert is_match(dimm, {"module_gb": 0.3}) is True
+    assert is_match(dimm, {"module_gb": 0.5}) is False
+
 
 def test_match_module_ranks_exact():
     dimm = base_dimm(module_ranks="2R")
@@ -257,6 +264,29 @@ def test_all_constraints_and_tight_match():
     assert is_match(dimm, entry) is True
 
 
+def test_normalize_dimm_data_is_idempotent_on_merged_dimm():
+    """
+    Re-normalizing a DIMM that already carries its normalized fields must not
+    change it; the scanner relies on this to skip a second pass.
+    """
+    dimm = {
+        "Memory Type": "DDR4 SDRAM",
+        "Module Manufacturer": "G.Skill",
+        "DRAM Manufacturer": "SK Hynix",
+        "Size": "16384 MB",
+        "Ranks": "1",
+        "SDRAM Device Width": "8 bits",
+        "Part Number": "F4-3600C18-32GVK",
+        "XMP Voltage": "1.35 V",
+        "Module Nominal Voltage": "1.2 V",
+        "gskill_sticker_code": " 21A ",
+    }
+    dimm.update(normalize_dimm_data(dimm))
+    merged = dict(dimm)
+    merged.update(normalize_dimm_data(dimm))
+    assert merged == dimm
+
+
 def test_f4_3600c18_32gvk_priority_500_rule_matches_correct_die_type():
     """
     Validate the production heuristic for:
@@ -371,4 +401,59 @@ def test_corsair_ddr4_module_detection():
     assert "B-Die" in die_type
     print(f"✓ Corsair DDR4 module detected: {die_type} (version 4.31)")
     # Verify we correctly identified Samsung B-Die
-    assert "Samsung" in die_type and "B-Die" in die_type
\ No newline at end of file
+    assert "Samsung" in die_type and "B-Die" in die_type
+
+
+def test_find_die_type_index_matches_full_scan():
+    """
+    index_database() must only narrow candidates, never change the outcome.
+    """
+    db_entries = load_database("die_database.json")
+    index = index_database(db_entries)
+
+    dimms = [
+        base_dimm(),
+        base_dimm(generation="DDR5", dram_mfg="SK Hynix", hynix_ic_part_number="H5CG48MEBDX014"),
+        base_dimm(dram_mfg="Samsung", timings_xmp="3200-14-14-14", module_ranks="1R", module_gb=8),
+        base_dimm(manufacturer="Corsair", corsair_version="4.31"),
+        base_dimm(dram_mfg="sk hynix", module_part_number="F4-3600C18-32GVK"),
+        {"generation": "DDR4"},
+        {},
+    ]
+    for dimm in dimms:
+        assert find_die_type(dimm, db_entries, index) == find_die_type(dimm, db_entries)
+
+
+def test_find_die_type_memoizes_identical_dimms():
+    db_entries = load_database("die_database.json")
+    index = index_database(db_entries)
+
+    first = find_die_type(base_dimm(), db_entries, index)
+    assert len(index["results"]) == 1
+    assert find_die_type(base_dimm(), db_entries, index) == first
+    assert len(index["results"]) == 1
+
+    # A value that only differs by type must not reuse the cached result.
+    find_die_type(base_dimm(voltage_xmp=1.35), db_entries, index)
+    assert len(index["results"]) == 2
+
+
+def test_load_database_rejects_non_string_constraints(tmp_path):
+    db_file = tmp_path / "db.json"
+    db_file.write_text(
+        json.dumps([{"priority": 1, "die_type": "X", "dram_mfg": 5}]),
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match="'dram_mfg' must be a string"):
+        load_database(str(db_file))
+
+
+def test_find_die_type_unsorted_db_picks_highest_priority():
+    db_entries = [
+        {"priority": 10, "die_type": "Low", "generation": "DDR4"},
+        {"priority": 50, "die_type": "High", "generation": "DDR4"},
+    ]
+    dimm = base_dimm()
+
+    assert find_die_type(dimm, db_entries) == ("High", None)
+    assert find_die_type(dimm, db_entries, index_database(db_entries)) == ("High", None)
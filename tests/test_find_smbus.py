@@ -0,0 +1,53 @@
+import subprocess
+
+from ramsleuth_pkg import scanner
+
+
+# (bus, adapter name, i2cdetect type column) as reported by a typical desktop.
+ADAPTERS = [
+    (0, "SMBus PIIX4 adapter port 0 at 0b00", "smbus"),
+    (1, "SMBus PIIX4 adapter port 2 at 0b00", "smbus"),
+    (2, "NVIDIA i2c adapter 1 at 1:00.0", "i2c"),
+    (3, "AMDGPU DM i2c hw bus 0", "i2c"),
+    (4, "Synopsys DesignWare I2C adapter", "i2c"),
+    (5, "sch_smbus", "smbus"),
+    (6, "ChipXYZ bus", "smbus"),
+    (7, "dummy-bus", "unknown"),
+]
+
+FUNCTIONALITY = {
+    "i2c": "I2C adapter",
+    "smbus": "SMBus adapter",
+    "unknown": "N/A",
+}
+
+
+def _i2cdetect_listing():
+    lines = [
+        f"i2c-{bus}\t{kind:<10}\t{name:<32}\t{FUNCTIONALITY[kind]}"
+        for bus, name, kind in ADAPTERS
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_sysfs_discovery_matches_i2cdetect(tmp_path, monkeypatch):
+    for bus, name, _kind in ADAPTERS:
+        adapter_dir = tmp_path / f"i2c-{bus}"
+        adapter_dir.mkdir()
+        (adapter_dir / "name").write_text(name + "\n")
+    kinds = {bus: kind for bus, _name, kind in ADAPTERS}
+
+    monkeypatch.setattr(scanner, "_I2C_DEV_SYSFS", str(tmp_path))
+    monkeypatch.setattr(scanner, "_is_smbus_adapter", lambda bus: kinds[bus] == "smbus")
+    monkeypatch.setattr(scanner, "_tool_path", lambda name: "/usr/sbin/i2cdetect")
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, _i2cdetect_listing(), b""),
+    )
+
+    sysfs_busses = scanner._find_smbus_sysfs()
+    monkeypatch.setattr(scanner, "_find_smbus_sysfs", lambda: [])
+    i2cdetect_busses = scanner.find_smbus()
+
+    assert sysfs_busses == i2cdetect_busses == [0, 1, 5, 6]
@@ -227,6 +227,34 @@ class TestSettingsService(unittest.TestCase):
         settings2 = SettingsService(debug=False)
         self.assertEqual(settings2.get_setting("theme"), "dark")
     
+    def test_save_settings_skips_unchanged_file(self) -> None:
+        """Test that saving identical settings does not rewrite the file."""
+        settings = SettingsService(debug=False)
+        settings.set_setting("theme", "light")
+
+        config_file = self.config_home / "ramsleuth" / "ramsleuth_config.json"
+        os.utime(config_file, ns=(0, 0))
+
+        settings.save_settings()
+        self.assertEqual(config_file.stat().st_mtime_ns, 0)
+
+        settings.set_setting("theme", "dark")
+        self.assertNotEqual(config_file.stat().st_mtime_ns, 0)
+        with open(config_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["theme"], "dark")
+
+    def test_set_setting_skips_save_for_unchanged_value(self) -> None:
+        """Test that re-setting the current value does not save again."""
+        settings = SettingsService(debug=False)
+        settings.set_setting("theme", "light")
+
+        with patch.object(settings, 'save_settings') as mock_save:
+            self.assertTrue(settings.set_setting("theme", "light"))
+            mock_save.assert_not_called()
+
+            self.assertTrue(settings.set_setting("theme", "dark"))
+            mock_save.assert_called_once()
+
     @patch('builtins.open')
     @patch('pathlib.Path.mkdir')
     @patch('subprocess.run')
@@ -355,7 +383,31 @@ class TestSettingsService(unittest.TestCase):
         
         self.assertEqual(config["theme"], "light")
         self.assertEqual(config["active_tab"], "full_tab")
-    
+
+    def test_load_config_reuses_parsed_file_until_changed(self) -> None:
+        """Test that an unchanged config file is parsed only once."""
+        config_dir = self.config_home / "ramsleuth"
+        config_dir.mkdir(parents=True)
+        config_file = config_dir / "ramsleuth_config.json"
+
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump({"theme": "light"}, f)
+
+        self.assertEqual(load_config(debug=False)["theme"], "light")
+
+        with patch('settings_service._json_loads') as mock_load:
+            config = load_config(debug=False)
+            mock_load.assert_not_called()
+        self.assertEqual(config["theme"], "light")
+
+        # Mutating a returned snapshot must not leak into later loads
+        config["theme"] = "dark"
+        self.assertEqual(load_config(debug=False)["theme"], "light")
+
+        # Saving invalidates the cached copy
+        save_config({"theme": "dark"}, debug=False)
+        self.assertEqual(load_config(debug=False)["theme"], "dark")
+
     def test_backward_compatibility_save_config(self) -> None:
         """Test backward compatibility save_config function."""
         test_config = {"theme": "light", "active_tab": "full_tab"}